@@ -25,11 +25,6 @@ from .tools import (
 )
 from ..forms.form_handler import FormHandler
 from ..forms.form_widgets import FormPanel
-from ..pages.merge_dialog import MergeDialog
-from ..pages.split_dialog import SplitDialog
-from ..pages.extract_dialog import ExtractDialog
-from ..ocr.ocr_dialog import OCRDialog
-from ..styles import THEME
 from ..utils.settings import Settings
 from ..utils.file_io import get_open_path, get_save_path
 from ..utils.logger import get_logger
@@ -56,9 +51,6 @@ class EditorWindow(QMainWindow):
         self._setup_menu()
         self._connect_signals()
 
-        # Apply theme
-        self.setStyleSheet(THEME)
-
         # Set default tool
         self._set_tool("select")
 
@@ -568,6 +560,8 @@ class EditorWindow(QMainWindow):
 
     def _show_merge_dialog(self):
         """Show merge PDFs dialog."""
+        from ..pages.merge_dialog import MergeDialog
+
         dialog = MergeDialog(self)
         if self._document.is_open and self._document.path:
             dialog.add_file(str(self._document.path))
@@ -579,6 +573,8 @@ class EditorWindow(QMainWindow):
             QMessageBox.warning(self, "No Document", "Please open a PDF first.")
             return
 
+        from ..pages.split_dialog import SplitDialog
+
         dialog = SplitDialog(self._document, self)
         dialog.exec()
 
@@ -588,6 +584,8 @@ class EditorWindow(QMainWindow):
             QMessageBox.warning(self, "No Document", "Please open a PDF first.")
             return
 
+        from ..pages.extract_dialog import ExtractDialog
+
         dialog = ExtractDialog(self._document, self)
         dialog.select_page(self._canvas.current_page)
         dialog.exec()
@@ -598,6 +596,8 @@ class EditorWindow(QMainWindow):
             QMessageBox.warning(self, "No Document", "Please open a PDF first.")
             return
 
+        from ..ocr.ocr_dialog import OCRDialog
+
         dialog = OCRDialog(self._document, self)
         dialog.exec()
 
@@ -1,7 +1,7 @@
 """PDF document wrapper using PyMuPDF (fitz)."""
 
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, Callable, Union
 from dataclasses import dataclass
 
 import fitz  # PyMuPDF
@@ -12,6 +12,9 @@ from ..utils.logger import get_logger
 
 log = get_logger("pdf_document")
 
+# Buffer size for output files written through a Python file object
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 @dataclass
 class SearchResult:
@@ -21,6 +24,27 @@ class SearchResult:
     text: str
 
 
+@dataclass
+class DocumentSnapshot:
+    """A document's state that a background job can reopen on its own thread.
+
+    ``source`` is the file path for a saved document, or the serialized
+    PDF when there are unsaved edits.
+    """
+    source: Optional[Union[str, bytes]]
+    path: Optional[Path]
+
+    def open(self) -> "PDFDocument":
+        """Open a detached PDFDocument; the caller must close it."""
+        document = PDFDocument()
+        if isinstance(self.source, bytes):
+            document._doc = fitz.open(stream=self.source, filetype="pdf")
+        elif self.source:
+            document._doc = fitz.open(self.source)
+        document._path = self.path
+        return document
+
+
 @dataclass
 class OutlineItem:
     """Represents a bookmark/outline item."""
@@ -74,6 +98,11 @@ class PDFDocument(QObject):
         """Check if document has unsaved changes."""
         return self._modified
 
+    @property
+    def raw_doc(self) -> Optional[fitz.Document]:
+        """Get the underlying PyMuPDF document."""
+        return self._doc
+
     @property
     def metadata(self) -> dict:
         """Get document metadata."""
@@ -126,6 +155,21 @@ class PDFDocument(QObject):
         """Save the PDF to a new location."""
         return self.save(path)
 
+    def snapshot(self) -> DocumentSnapshot:
+        """Get the document's current state for a background job.
+
+        PyMuPDF is not thread-safe, so background jobs open their own
+        handle while the original keeps rendering on the GUI thread. Saved
+        documents are reopened from disk; only unsaved edits are copied.
+        """
+        if not self._doc:
+            source = None
+        elif self._path and not self._modified:
+            source = str(self._path)
+        else:
+            source = self._doc.tobytes()
+        return DocumentSnapshot(source, self._path)
+
     def close(self):
         """Close the document."""
         if self._doc:
@@ -282,6 +326,20 @@ class PDFDocument(QObject):
             self.page_count_changed.emit(len(self._doc))
             log.info(f"Deleted page {index}")
 
+    def delete_pages(self, indices: list[int]):
+        """Delete several pages in one call."""
+        if not self._doc:
+            return
+        count = len(self._doc)
+        valid = sorted({i for i in indices if 0 <= i < count})
+        if not valid:
+            return
+        self._doc.delete_pages(valid)
+        self._mark_modified()
+        self._page_cache.clear()
+        self.page_count_changed.emit(len(self._doc))
+        log.info(f"Deleted {len(valid)} pages")
+
     def insert_blank_page(
         self,
         index: int,
@@ -306,21 +364,25 @@ class PDFDocument(QObject):
             self._page_cache.clear()
             log.info(f"Moved page {from_index} to {to_index}")
 
+    def _new_doc_from_pages(self, indices: list[int]) -> fitz.Document:
+        """Build a new document holding copies of the given pages."""
+        new_doc = fitz.open()
+        for idx in sorted(indices):
+            if 0 <= idx < len(self._doc):
+                new_doc.insert_pdf(
+                    self._doc,
+                    from_page=idx,
+                    to_page=idx
+                )
+        return new_doc
+
     def extract_pages(self, indices: list[int]) -> Optional[bytes]:
         """Extract pages to a new PDF (returns bytes)."""
         if not self._doc:
             return None
 
         try:
-            new_doc = fitz.open()
-            for idx in sorted(indices):
-                if 0 <= idx < len(self._doc):
-                    new_doc.insert_pdf(
-                        self._doc,
-                        from_page=idx,
-                        to_page=idx
-                    )
-
+            new_doc = self._new_doc_from_pages(indices)
             pdf_bytes = new_doc.tobytes(garbage=4, deflate=True)
             new_doc.close()
             return pdf_bytes
@@ -328,6 +390,21 @@ class PDFDocument(QObject):
             log.error(f"Failed to extract pages: {e}")
             return None
 
+    def extract_pages_to(self, indices: list[int], output_path: str) -> bool:
+        """Extract pages to a new PDF file without an in-memory copy."""
+        if not self._doc:
+            return False
+
+        try:
+            new_doc = self._new_doc_from_pages(indices)
+            with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                new_doc.save(f, garbage=4, deflate=True)
+            new_doc.close()
+            return True
+        except Exception as e:
+            log.error(f"Failed to extract pages: {e}")
+            return False
+
     # Annotations
     def get_annotations(self, page_index: int) -> list[Any]:
         """Get annotations on a page."""
@@ -423,14 +500,23 @@ class PDFDocument(QObject):
 
     # Merge/Split
     @staticmethod
-    def merge_pdfs(paths: list[str], output_path: str) -> bool:
-        """Merge multiple PDFs into one."""
+    def merge_pdfs(
+        paths: list[str],
+        output_path: str,
+        progress: Optional[Callable[[int], None]] = None
+    ) -> bool:
+        """Merge multiple PDFs into one.
+
+        ``progress`` is called with the number of files merged so far.
+        """
         try:
             merged = fitz.open()
-            for path in paths:
+            for i, path in enumerate(paths, 1):
                 doc = fitz.open(path)
                 merged.insert_pdf(doc)
                 doc.close()
+                if progress:
+                    progress(i)
 
             merged.save(output_path, garbage=4, deflate=True)
             merged.close()
@@ -443,9 +529,15 @@ class PDFDocument(QObject):
     def split_by_pages(
         self,
         output_dir: str,
-        pages_per_file: int = 1
+        pages_per_file: int = 1,
+        progress: Optional[Callable[[int], None]] = None,
+        fast: bool = True
     ) -> list[str]:
-        """Split PDF into multiple files."""
+        """Split PDF into multiple files.
+
+        ``progress`` is called with the number of files written so far.
+        ``fast`` skips garbage collection and compression of each output.
+        """
         if not self._doc:
             return []
 
@@ -464,10 +556,15 @@ class PDFDocument(QObject):
 
             name = self._path.stem if self._path else "split"
             out_file = output_path / f"{name}_part{file_num}.pdf"
-            new_doc.save(str(out_file), garbage=4, deflate=True)
+            if fast:
+                new_doc.save(str(out_file), garbage=0, deflate=False)
+            else:
+                new_doc.save(str(out_file), garbage=4, deflate=True)
             new_doc.close()
 
             output_paths.append(str(out_file))
+            if progress:
+                progress(file_num)
             file_num += 1
 
         log.info(f"Split PDF into {len(output_paths)} files")
@@ -10,6 +10,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal
 
 from .pdf_document import PDFDocument, SearchResult
+from ..styles import qss
 from ..utils.logger import get_logger
 
 log = get_logger("search_panel")
@@ -88,7 +89,7 @@ class SearchPanel(QWidget):
 
         # Results count
         self._count_label = QLabel("")
-        self._count_label.setStyleSheet("color: #8E8E93;")
+        self._count_label.setStyleSheet(qss("secondary_text"))
         layout.addWidget(self._count_label)
 
         # Results list
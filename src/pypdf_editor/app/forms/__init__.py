@@ -2,21 +2,15 @@
 
 from .form_handler import FormHandler, FormField
 from .form_widgets import (
-    FormFieldWidget,
-    TextFieldWidget,
-    TextAreaWidget,
-    CheckboxWidget,
-    ComboBoxWidget,
+    FormFieldModel,
+    FormFieldDelegate,
     FormPanel,
 )
 
 __all__ = [
     "FormHandler",
     "FormField",
-    "FormFieldWidget",
-    "TextFieldWidget",
-    "TextAreaWidget",
-    "CheckboxWidget",
-    "ComboBoxWidget",
+    "FormFieldModel",
+    "FormFieldDelegate",
     "FormPanel",
 ]
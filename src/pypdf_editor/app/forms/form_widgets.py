@@ -4,10 +4,12 @@ from typing import Any
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QLineEdit, QCheckBox, QComboBox, QTextEdit,
-    QScrollArea, QFrame, QPushButton, QGroupBox
+    QLineEdit, QComboBox, QFrame, QPushButton, QListView,
+    QAbstractItemView, QStyledItemDelegate
+)
+from PyQt6.QtCore import (
+    Qt, QAbstractListModel, QModelIndex, pyqtSignal, pyqtSlot
 )
-from PyQt6.QtCore import Qt, pyqtSignal
 
 from .form_handler import FormHandler, FormField
 from ..utils.logger import get_logger
@@ -15,137 +17,123 @@ from ..utils.logger import get_logger
 log = get_logger("form_widgets")
 
 
-class FormFieldWidget(QWidget):
-    """Base widget for a form field."""
-
-    value_changed = pyqtSignal(object, object)  # field, new_value
-
-    def __init__(self, field: FormField, parent=None):
-        super().__init__(parent)
-        self.field = field
-        self._setup_ui()
-
-    def _setup_ui(self):
-        """Override in subclasses."""
-        pass
-
-    def get_value(self) -> Any:
-        """Get the current value."""
-        return None
-
-    def set_value(self, value: Any):
-        """Set the value."""
-        pass
-
-
-class TextFieldWidget(FormFieldWidget):
-    """Widget for text input fields."""
-
-    def _setup_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 8)
-
-        # Label
-        label = QLabel(self.field.name or "Text Field")
-        label.setStyleSheet("font-weight: 500; color: #1C1C1E;")
-        layout.addWidget(label)
-
-        # Input
-        self._input = QLineEdit()
-        self._input.setText(str(self.field.value or ""))
-        self._input.textChanged.connect(self._on_changed)
-        layout.addWidget(self._input)
-
-    def _on_changed(self, text: str):
-        self.value_changed.emit(self.field, text)
-
-    def get_value(self) -> str:
-        return self._input.text()
-
-    def set_value(self, value: Any):
-        self._input.setText(str(value or ""))
-
-
-class TextAreaWidget(FormFieldWidget):
-    """Widget for multi-line text fields."""
-
-    def _setup_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 8)
-
-        label = QLabel(self.field.name or "Text Area")
-        label.setStyleSheet("font-weight: 500; color: #1C1C1E;")
-        layout.addWidget(label)
-
-        self._input = QTextEdit()
-        self._input.setPlainText(str(self.field.value or ""))
-        self._input.setMaximumHeight(100)
-        self._input.textChanged.connect(self._on_changed)
-        layout.addWidget(self._input)
-
-    def _on_changed(self):
-        self.value_changed.emit(self.field, self._input.toPlainText())
-
-    def get_value(self) -> str:
-        return self._input.toPlainText()
+# Field types: 0=unknown, 1=pushbutton, 2=checkbox, 3=radiobutton,
+#              4=text, 5=listbox, 6=combobox, 7=signature
+CHECK_FIELD_TYPES = (2, 3)  # Radio treated as checkbox for now
+CHOICE_FIELD_TYPES = (5, 6)
 
-    def set_value(self, value: Any):
-        self._input.setPlainText(str(value or ""))
+# Role holding the FormField behind a model row
+FIELD_ROLE = Qt.ItemDataRole.UserRole
 
 
-class CheckboxWidget(FormFieldWidget):
-    """Widget for checkbox fields."""
+class FormFieldModel(QAbstractListModel):
+    """List model exposing form fields as rows."""
 
-    def _setup_ui(self):
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 8)
-
-        self._checkbox = QCheckBox(self.field.name or "Checkbox")
-        self._checkbox.setChecked(bool(self.field.value))
-        self._checkbox.stateChanged.connect(self._on_changed)
-        layout.addWidget(self._checkbox)
-        layout.addStretch()
-
-    def _on_changed(self, state: int):
-        checked = state == Qt.CheckState.Checked.value
-        self.value_changed.emit(self.field, checked)
-
-    def get_value(self) -> bool:
-        return self._checkbox.isChecked()
+    value_edited = pyqtSignal(object, object)  # field, new_value
 
-    def set_value(self, value: Any):
-        self._checkbox.setChecked(bool(value))
-
-
-class ComboBoxWidget(FormFieldWidget):
-    """Widget for dropdown/choice fields."""
-
-    def _setup_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 8)
-
-        label = QLabel(self.field.name or "Selection")
-        label.setStyleSheet("font-weight: 500; color: #1C1C1E;")
-        layout.addWidget(label)
-
-        self._combo = QComboBox()
-        # Add options if available
-        # For now, add the current value
-        if self.field.value:
-            self._combo.addItem(str(self.field.value))
-        self._combo.currentTextChanged.connect(self._on_changed)
-        layout.addWidget(self._combo)
-
-    def _on_changed(self, text: str):
-        self.value_changed.emit(self.field, text)
-
-    def get_value(self) -> str:
-        return self._combo.currentText()
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._fields: list[FormField] = []
+
+    @property
+    def fields(self) -> list[FormField]:
+        """Get the fields backing the model."""
+        return self._fields
+
+    def set_fields(self, fields: list[FormField]):
+        """Replace all fields."""
+        self.beginResetModel()
+        self._fields = list(fields)
+        self.endResetModel()
+
+    def replace_values(self, fields: list[FormField]):
+        """Swap in fresh fields for the same rows without a model reset."""
+        self._fields = list(fields)
+        if self._fields:
+            self.dataChanged.emit(self.index(0), self.index(len(self._fields) - 1))
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._fields)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        field = self._fields[index.row()]
+        is_check = field.field_type in CHECK_FIELD_TYPES
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            name = field.name or ("Checkbox" if is_check else "Text Field")
+            if is_check:
+                return name
+            return f"{name}: {field.value or ''}"
+        if role == Qt.ItemDataRole.EditRole:
+            return field.value
+        if role == Qt.ItemDataRole.CheckStateRole and is_check:
+            return Qt.CheckState.Checked if field.value else Qt.CheckState.Unchecked
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return field.name
+        if role == FIELD_ROLE:
+            return field
+        return None
 
-    def set_value(self, value: Any):
-        index = self._combo.findText(str(value))
-        if index >= 0:
-            self._combo.setCurrentIndex(index)
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if self._fields[index.row()].field_type in CHECK_FIELD_TYPES:
+            return flags | Qt.ItemFlag.ItemIsUserCheckable
+        return flags | Qt.ItemFlag.ItemIsEditable
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid():
+            return False
+
+        field = self._fields[index.row()]
+        if role == Qt.ItemDataRole.CheckStateRole:
+            value = Qt.CheckState(value) == Qt.CheckState.Checked
+        elif role != Qt.ItemDataRole.EditRole:
+            return False
+
+        if value == field.value:
+            return False
+
+        self.value_edited.emit(field, value)
+        self.dataChanged.emit(index, index)
+        return True
+
+
+class FormFieldDelegate(QStyledItemDelegate):
+    """Creates an editor for a form field row only while it is edited."""
+
+    def createEditor(self, parent, option, index: QModelIndex) -> QWidget:
+        field = index.data(FIELD_ROLE)
+        if field.field_type in CHOICE_FIELD_TYPES:
+            editor = QComboBox(parent)
+            choices = getattr(field.widget, "choice_values", None) or []
+            if field.value and field.value not in choices:
+                editor.addItem(str(field.value))
+            editor.addItems([str(c) for c in choices])
+            return editor
+        return QLineEdit(parent)
+
+    def setEditorData(self, editor: QWidget, index: QModelIndex):
+        value = index.data(Qt.ItemDataRole.EditRole)
+        if isinstance(editor, QComboBox):
+            i = editor.findText(str(value))
+            if i >= 0:
+                editor.setCurrentIndex(i)
+        else:
+            editor.setText(str(value or ""))
+
+    def setModelData(self, editor: QWidget, model: QAbstractListModel, index: QModelIndex):
+        if isinstance(editor, QComboBox):
+            model.setData(index, editor.currentText())
+        else:
+            model.setData(index, editor.text())
 
 
 class FormPanel(QWidget):
@@ -156,7 +144,8 @@ class FormPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._form_handler = None
-        self._field_widgets: list[FormFieldWidget] = []
+        self._model = FormFieldModel(self)
+        self._model.value_edited.connect(self._on_field_changed)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -173,20 +162,20 @@ class FormPanel(QWidget):
         """)
         layout.addWidget(header)
 
-        # Scroll area for fields
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.Shape.NoFrame)
-        scroll.setStyleSheet("background: transparent;")
-
-        self._fields_container = QWidget()
-        self._fields_layout = QVBoxLayout(self._fields_container)
-        self._fields_layout.setContentsMargins(0, 0, 0, 0)
-        self._fields_layout.setSpacing(8)
-        self._fields_layout.addStretch()
-
-        scroll.setWidget(self._fields_container)
-        layout.addWidget(scroll)
+        # Virtualized field list - editors only exist for the row being edited
+        self._fields_view = QListView()
+        self._fields_view.setFrameShape(QFrame.Shape.NoFrame)
+        self._fields_view.setStyleSheet("background: transparent;")
+        self._fields_view.setUniformItemSizes(True)
+        self._fields_view.setSpacing(4)
+        self._fields_view.setEditTriggers(
+            QAbstractItemView.EditTrigger.CurrentChanged
+            | QAbstractItemView.EditTrigger.DoubleClicked
+            | QAbstractItemView.EditTrigger.EditKeyPressed
+        )
+        self._fields_view.setItemDelegate(FormFieldDelegate(self._fields_view))
+        self._fields_view.setModel(self._model)
+        layout.addWidget(self._fields_view)
 
         # No fields message
         self._empty_label = QLabel("No form fields found")
@@ -220,16 +209,9 @@ class FormPanel(QWidget):
 
     def _load_fields(self):
         """Load form fields from the handler."""
-        # Clear existing widgets
-        for widget in self._field_widgets:
-            widget.deleteLater()
-        self._field_widgets.clear()
+        fields = self._form_handler.get_all_fields() if self._form_handler else []
+        self._model.set_fields(fields)
 
-        if not self._form_handler:
-            self._show_empty()
-            return
-
-        fields = self._form_handler.get_all_fields()
         if not fields:
             self._show_empty()
             return
@@ -238,57 +220,50 @@ class FormPanel(QWidget):
         self._save_btn.show()
         self._reset_btn.show()
 
-        # Create widgets for each field
-        for field in fields:
-            widget = self._create_field_widget(field)
-            if widget:
-                widget.value_changed.connect(self._on_field_changed)
-                # Insert before the stretch
-                self._fields_layout.insertWidget(
-                    self._fields_layout.count() - 1,
-                    widget
-                )
-                self._field_widgets.append(widget)
-
         log.info(f"Loaded {len(fields)} form fields")
 
-    def _create_field_widget(self, field: FormField) -> FormFieldWidget:
-        """Create appropriate widget for field type."""
-        # Field types: 0=unknown, 1=pushbutton, 2=checkbox, 3=radiobutton,
-        #              4=text, 5=listbox, 6=combobox, 7=signature
-
-        if field.field_type == 2:  # Checkbox
-            return CheckboxWidget(field)
-        elif field.field_type == 3:  # Radio
-            return CheckboxWidget(field)  # Treat as checkbox for now
-        elif field.field_type in (5, 6):  # List/Combo
-            return ComboBoxWidget(field)
-        else:  # Default to text
-            return TextFieldWidget(field)
-
     def _show_empty(self):
         """Show empty state."""
         self._empty_label.show()
         self._save_btn.hide()
         self._reset_btn.hide()
 
+    @pyqtSlot(object, object)
     def _on_field_changed(self, field: FormField, value: Any):
         """Handle field value change."""
         if self._form_handler:
             self._form_handler.set_field_value(field, value)
         self.field_changed.emit(field, value)
 
+    @pyqtSlot()
     def _save_form(self):
         """Save all form data."""
-        for widget in self._field_widgets:
-            value = widget.get_value()
-            if self._form_handler:
-                self._form_handler.set_field_value(widget.field, value)
+        # Commit the row still being edited before serializing; delegate
+        # editors are not index widgets, but the open one has focus
+        view = self._fields_view
+        if view.state() == QAbstractItemView.State.EditingState:
+            editor = view.focusWidget()
+            if editor:
+                view.commitData(editor)
+
+        if self._form_handler:
+            for field in self._model.fields:
+                self._form_handler.set_field_value(field, field.value)
         log.info("Form data saved")
 
+    @pyqtSlot()
     def _reset_form(self):
         """Reset form to original values."""
-        self._load_fields()
+        fields = self._form_handler.get_all_fields() if self._form_handler else []
+        if self._field_keys(fields) != self._field_keys(self._model.fields):
+            # Field set changed - a full rebuild is needed
+            self._load_fields()
+            return
+        self._model.replace_values(fields)
+
+    def _field_keys(self, fields) -> list[tuple[int, str]]:
+        """Identify a field set by page and name."""
+        return [(field.page, field.name) for field in fields]
 
     def refresh(self):
         """Refresh the form fields."""
@@ -1,5 +1,7 @@
 """Main launcher window for PyPDF Editor."""
 
+import os
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -8,16 +10,21 @@ from PyQt6.QtWidgets import (
     QPushButton, QLabel, QListWidget, QListWidgetItem,
     QFrame, QSizePolicy
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
+from PyQt6.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot, QSize
+)
 from PyQt6.QtGui import QFont
 
-from .styles import THEME, MACOS_COLORS
-from .utils.settings import Settings
+from .styles import MACOS_COLORS
+from .utils.settings import take_preloaded_settings
 from .utils.file_io import get_open_path
 from .utils.logger import get_logger
 
 log = get_logger("main_window")
 
+# How long a recent file's existence check stays valid (seconds)
+RECENT_EXISTS_TTL = 30.0
+
 
 class RecentFileItem(QListWidgetItem):
     """List item for recent files."""
@@ -30,6 +37,30 @@ class RecentFileItem(QListWidgetItem):
         self.setToolTip(path)
 
 
+class RecentFileCheckSignals(QObject):
+    """Signals for RecentFileChecker."""
+
+    checked = pyqtSignal(str, bool)  # path, exists
+
+
+class RecentFileChecker(QRunnable):
+    """Background check of which recent files still exist."""
+
+    def __init__(self, paths: list[str]):
+        super().__init__()
+        self.signals = RecentFileCheckSignals()
+        self._paths = paths
+
+    def run(self):
+        for path in self._paths:
+            try:
+                os.stat(path)
+                exists = True
+            except OSError:
+                exists = False
+            self.signals.checked.emit(path, exists)
+
+
 class MainWindow(QMainWindow):
     """Main launcher window."""
 
@@ -37,11 +68,13 @@ class MainWindow(QMainWindow):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._settings = Settings()
+        self._settings = take_preloaded_settings()
         self._editor_windows = []
+        self._recent_items: dict[str, RecentFileItem] = {}
+        self._recent_checker: Optional[RecentFileChecker] = None
+        self._exists_cache: dict[str, tuple[float, bool]] = {}  # path -> (time, exists)
 
         self._setup_ui()
-        self.setStyleSheet(THEME)
 
     def _setup_ui(self):
         """Set up the UI."""
@@ -146,25 +179,78 @@ class MainWindow(QMainWindow):
     def _load_recent_files(self):
         """Load recent files from settings."""
         self._recent_list.clear()
+        self._recent_items = {}
         recent = self._settings.get_recent_files()
 
         if not recent:
-            empty_item = QListWidgetItem("No recent files")
-            empty_item.setFlags(Qt.ItemFlag.NoItemFlags)
-            self._recent_list.addItem(empty_item)
+            self._show_no_recent_files()
             return
 
+        # Show unchecked entries as disabled placeholders and stat them
+        # off the GUI thread
+        now = time.monotonic()
+        unchecked = []
         for path in recent:
-            if Path(path).exists():
-                item = RecentFileItem(path)
+            cached = self._exists_cache.get(path)
+            fresh = cached is not None and now - cached[0] < RECENT_EXISTS_TTL
+            if fresh and not cached[1]:
+                continue
+
+            item = RecentFileItem(path)
+            if not fresh:
+                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEnabled)
+                unchecked.append(path)
+            self._recent_items[path] = item
+
+        if not self._recent_items:
+            # Every entry is cached as missing
+            self._show_no_recent_files()
+            return
+
+        # Insert all rows with view updates suspended
+        self._recent_list.setUpdatesEnabled(False)
+        try:
+            for item in self._recent_items.values():
                 self._recent_list.addItem(item)
+        finally:
+            self._recent_list.setUpdatesEnabled(True)
+
+        if unchecked:
+            self._recent_checker = RecentFileChecker(unchecked)
+            self._recent_checker.signals.checked.connect(self._on_recent_checked)
+            QThreadPool.globalInstance().start(self._recent_checker)
+
+    @pyqtSlot(str, bool)
+    def _on_recent_checked(self, path: str, exists: bool):
+        """Enable or drop a recent file entry once its path is checked."""
+        self._exists_cache[path] = (time.monotonic(), exists)
+
+        item = self._recent_items.get(path)
+        if item is None:
+            return
 
+        if exists:
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEnabled)
+        else:
+            self._recent_list.takeItem(self._recent_list.row(item))
+            del self._recent_items[path]
+            if not self._recent_items:
+                self._show_no_recent_files()
+
+    def _show_no_recent_files(self):
+        """Show the placeholder row for an empty recent files list."""
+        empty_item = QListWidgetItem("No recent files")
+        empty_item.setFlags(Qt.ItemFlag.NoItemFlags)
+        self._recent_list.addItem(empty_item)
+
+    @pyqtSlot()
     def _open_file(self):
         """Open file dialog."""
         path = get_open_path(self)
         if path:
             self._open_editor(str(path))
 
+    @pyqtSlot()
     def _create_new(self):
         """Create a new PDF (placeholder for now)."""
         log.info("Create new PDF requested")
@@ -172,6 +258,7 @@ class MainWindow(QMainWindow):
         # In Phase 4, this will create a blank PDF
         self._open_editor(None)
 
+    @pyqtSlot(QListWidgetItem)
     def _on_recent_clicked(self, item: QListWidgetItem):
         """Handle recent file click."""
         if isinstance(item, RecentFileItem):
@@ -1,7 +1,15 @@
-"""OCR modules."""
+"""OCR modules.
 
-from .ocr_engine import OCREngine, TESSERACT_AVAILABLE
-from .ocr_dialog import OCRDialog, OCRWorker
+Submodules are imported on first attribute access so that importing the
+package (e.g. in OCR worker processes) does not pull in Qt or Tesseract.
+"""
+
+_LAZY_ATTRS = {
+    "OCREngine": ".ocr_engine",
+    "TESSERACT_AVAILABLE": ".ocr_engine",
+    "OCRDialog": ".ocr_dialog",
+    "OCRWorker": ".ocr_dialog",
+}
 
 __all__ = [
     "OCREngine",
@@ -9,3 +17,10 @@ __all__ = [
     "OCRDialog",
     "OCRWorker",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        from importlib import import_module
+        return getattr(import_module(_LAZY_ATTRS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
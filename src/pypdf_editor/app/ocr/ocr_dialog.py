@@ -1,5 +1,6 @@
 """OCR dialog for text extraction from scanned pages."""
 
+from concurrent.futures import as_completed
 from typing import Optional
 
 from PyQt6.QtWidgets import (
@@ -7,14 +8,31 @@ from PyQt6.QtWidgets import (
     QLabel, QComboBox, QProgressBar, QTextEdit,
     QCheckBox, QSpinBox, QGroupBox, QMessageBox
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QTextCursor
 
-from .ocr_engine import OCREngine, TESSERACT_AVAILABLE
-from ..editor.pdf_document import PDFDocument
+from .ocr_engine import OCREngine, TESSERACT_AVAILABLE, ocr_page_job, scan_pages_job
+from ..editor.pdf_document import DocumentSnapshot, PDFDocument
+from ..styles import qss
 from ..utils.logger import get_logger
 
 log = get_logger("ocr_dialog")
 
+OCR_LANGUAGES = (
+    ("English", "eng"),
+    ("French", "fra"),
+    ("German", "deu"),
+    ("Spanish", "spa"),
+    ("Italian", "ita"),
+    ("Portuguese", "por"),
+    ("Dutch", "nld"),
+    ("Russian", "rus"),
+    ("Chinese Simplified", "chi_sim"),
+    ("Chinese Traditional", "chi_tra"),
+    ("Japanese", "jpn"),
+    ("Korean", "kor"),
+)
+
 
 class OCRWorker(QThread):
     """Worker thread for OCR processing."""
@@ -32,6 +50,15 @@ class OCRWorker(QThread):
         self._cancelled = False
 
     def run(self):
+        # Worker processes re-open the file, so unsaved edits need the
+        # in-process path to be OCR'd as the user sees them
+        if self._document.path and not self._document.is_modified:
+            results = self._run_parallel()
+        else:
+            results = self._run_serial()
+        self.finished.emit(results)
+
+    def _run_serial(self) -> dict:
         results = {}
         total = len(self._pages)
 
@@ -50,7 +77,114 @@ class OCRWorker(QThread):
             except Exception as e:
                 self.error.emit(f"Error on page {page_idx + 1}: {e}")
 
-        self.finished.emit(results)
+        return results
+
+    def _run_parallel(self) -> dict:
+        results = {}
+        total = len(self._pages)
+        pool = OCREngine.get_pool()
+        pdf_path = str(self._document.path)
+
+        futures = {
+            pool.submit(ocr_page_job, pdf_path, page_idx, None, self._engine.language): page_idx
+            for page_idx in self._pages
+        }
+
+        # Pages finish out of order; hold them until every earlier page is
+        # done so results are reported in page order
+        held: dict[int, tuple[Optional[str], Optional[Exception]]] = {}
+        next_pos = 0
+
+        for future in as_completed(futures):
+            if self._cancelled:
+                for pending in futures:
+                    pending.cancel()
+                break
+
+            page_idx = futures[future]
+            try:
+                _, text = future.result()
+                held[page_idx] = (text, None)
+            except Exception as e:
+                held[page_idx] = (None, e)
+
+            while next_pos < total and self._pages[next_pos] in held:
+                page_idx = self._pages[next_pos]
+                text, error = held.pop(page_idx)
+                next_pos += 1
+                self.progress.emit(next_pos, total)
+                if error is None:
+                    results[page_idx] = text
+                    self.page_completed.emit(page_idx, text)
+                else:
+                    self.error.emit(f"Error on page {page_idx + 1}: {error}")
+
+        return results
+
+    def cancel(self):
+        self._cancelled = True
+
+
+class ScanDetectWorker(QThread):
+    """Worker thread for detecting scanned pages."""
+
+    finished = pyqtSignal(dict)  # {page: is_scanned}
+
+    # Minimum page count before detection is spread over the process pool
+    PARALLEL_MIN_PAGES = 64
+
+    # Pages per pool job; small enough that cancelling never waits long
+    PARALLEL_CHUNK_PAGES = 16
+
+    def __init__(self, engine: OCREngine, snapshot: DocumentSnapshot, pages: list[int]):
+        super().__init__()
+        self._engine = engine
+        self._snapshot = snapshot
+        self._pages = pages
+        self._cancelled = False
+
+    def run(self):
+        # Pool start-up only pays off for larger documents; as with OCR,
+        # unsaved edits must be checked in-process
+        results = {}
+        try:
+            if (isinstance(self._snapshot.source, str)
+                    and len(self._pages) >= self.PARALLEL_MIN_PAGES):
+                self._run_parallel(results)
+            else:
+                self._run_serial(results)
+        except Exception as e:
+            log.error(f"Scanned page detection failed: {e}")
+        finally:
+            # Partial results are still useful; the rest is checked lazily
+            self.finished.emit(results)
+
+    def _run_serial(self, results: dict):
+        # Own handle; the editor keeps rendering the original
+        document = self._snapshot.open()
+        try:
+            for page_idx in self._pages:
+                if self._cancelled:
+                    break
+                page = document.get_page(page_idx)
+                results[page_idx] = bool(page) and self._engine.is_page_scanned(page)
+        finally:
+            document.close()
+
+    def _run_parallel(self, results: dict):
+        pool = OCREngine.get_pool()
+        pdf_path = self._snapshot.source
+        size = self.PARALLEL_CHUNK_PAGES
+        futures = [
+            pool.submit(scan_pages_job, pdf_path, self._pages[i:i + size])
+            for i in range(0, len(self._pages), size)
+        ]
+        for future in as_completed(futures):
+            if self._cancelled:
+                for pending in futures:
+                    pending.cancel()
+                break
+            results.update(future.result())
 
     def cancel(self):
         self._cancelled = True
@@ -59,14 +193,26 @@ class OCRWorker(QThread):
 class OCRDialog(QDialog):
     """Dialog for OCR text extraction."""
 
+    # Coalesce per-page result text into one relayout per interval
+    FLUSH_INTERVAL_MS = 50
+
     def __init__(self, document: PDFDocument, parent=None):
         super().__init__(parent)
         self._document = document
         self._engine = OCREngine()
         self._worker: Optional[OCRWorker] = None
         self._results: dict[int, str] = {}
+        self._scanned_cache: dict[int, bool] = {}
+        self._scan_worker: Optional[ScanDetectWorker] = None
+        self._start_after_scan = False
+        self._pending_text: list[str] = []
+        self._flush_scheduled = False
+        self._progress_bar: Optional[QProgressBar] = None
         self._setup_ui()
 
+        if TESSERACT_AVAILABLE:
+            self._start_scan_detection()
+
     def _setup_ui(self):
         self.setWindowTitle("OCR - Text Recognition")
         self.setMinimumSize(500, 500)
@@ -107,20 +253,8 @@ class OCRDialog(QDialog):
         lang_row.addWidget(QLabel("Language:"))
 
         self._lang_combo = QComboBox()
-        self._lang_combo.addItems([
-            "English (eng)",
-            "French (fra)",
-            "German (deu)",
-            "Spanish (spa)",
-            "Italian (ita)",
-            "Portuguese (por)",
-            "Dutch (nld)",
-            "Russian (rus)",
-            "Chinese Simplified (chi_sim)",
-            "Chinese Traditional (chi_tra)",
-            "Japanese (jpn)",
-            "Korean (kor)",
-        ])
+        for name, code in OCR_LANGUAGES:
+            self._lang_combo.addItem(f"{name} ({code})", code)
         lang_row.addWidget(self._lang_combo)
         lang_row.addStretch()
         settings_layout.addLayout(lang_row)
@@ -162,16 +296,14 @@ class OCRDialog(QDialog):
 
         # Progress
         self._progress_label = QLabel("Ready to start OCR")
-        self._progress_label.setStyleSheet("color: #8E8E93;")
+        self._progress_label.setStyleSheet(qss("secondary_text"))
         layout.addWidget(self._progress_label)
 
-        self._progress = QProgressBar()
-        self._progress.hide()
-        layout.addWidget(self._progress)
+        # Progress bar is created on first use - see _progress
 
         # Results
         results_label = QLabel("Extracted Text:")
-        results_label.setStyleSheet("font-weight: 600;")
+        results_label.setStyleSheet(qss("section_label"))
         layout.addWidget(results_label)
 
         self._results_text = QTextEdit()
@@ -205,6 +337,46 @@ class OCRDialog(QDialog):
 
         layout.addLayout(btn_layout)
 
+    @property
+    def _progress(self) -> QProgressBar:
+        """Get the progress bar, creating it below the progress label."""
+        if self._progress_bar is None:
+            self._progress_bar = QProgressBar()
+            layout = self.layout()
+            layout.insertWidget(layout.indexOf(self._progress_label) + 1, self._progress_bar)
+        return self._progress_bar
+
+    def _start_scan_detection(self):
+        """Detect scanned pages in the background."""
+        self._progress_label.setText("Detecting scanned pages...")
+
+        pages = list(range(self._document.page_count))
+        self._scan_worker = ScanDetectWorker(self._engine, self._document.snapshot(), pages)
+        self._scan_worker.finished.connect(self._on_scan_finished)
+        self._scan_worker.start()
+
+    @pyqtSlot(dict)
+    def _on_scan_finished(self, results: dict):
+        """Handle scanned page detection completion."""
+        self._scanned_cache.update(results)
+        if self._start_after_scan:
+            # Start was pressed with the scanned-only filter on
+            self._start_after_scan = False
+            self._start_btn.setEnabled(True)
+            self._start_ocr()
+        elif not (self._worker and self._worker.isRunning()):
+            self._progress_label.setText("Ready to start OCR")
+
+    def _is_scanned(self, page_idx: int) -> bool:
+        """Check whether a page is scanned, using the detection cache."""
+        scanned = self._scanned_cache.get(page_idx)
+        if scanned is None:
+            page = self._document.get_page(page_idx)
+            scanned = bool(page) and self._engine.is_page_scanned(page)
+            self._scanned_cache[page_idx] = scanned
+        return scanned
+
+    @pyqtSlot(bool)
     def _toggle_page_range(self, all_pages: bool):
         """Toggle page range inputs."""
         self._from_spin.setEnabled(not all_pages)
@@ -221,27 +393,25 @@ class OCRDialog(QDialog):
 
         # Filter to scanned pages if option is checked
         if self._detect_scanned.isChecked():
-            scanned = []
-            for idx in pages:
-                page = self._document.get_page(idx)
-                if page and self._engine.is_page_scanned(page):
-                    scanned.append(idx)
-            return scanned
+            return [idx for idx in pages if self._is_scanned(idx)]
 
         return pages
 
     def _get_language_code(self) -> str:
-        """Extract language code from combo selection."""
-        text = self._lang_combo.currentText()
-        # Extract code from "English (eng)" format
-        start = text.find('(')
-        end = text.find(')')
-        if start >= 0 and end > start:
-            return text[start + 1:end]
-        return "eng"
+        """Get the language code for the combo selection."""
+        return self._lang_combo.currentData() or "eng"
 
+    @pyqtSlot()
     def _start_ocr(self):
         """Start the OCR process."""
+        if (self._detect_scanned.isChecked() and self._scan_worker
+                and self._scan_worker.isRunning()):
+            # The filter needs detection results; start once they arrive
+            self._start_after_scan = True
+            self._start_btn.setEnabled(False)
+            self._progress_label.setText("Detecting scanned pages...")
+            return
+
         pages = self._get_pages_to_process()
 
         if not pages:
@@ -264,6 +434,7 @@ class OCRDialog(QDialog):
         self._progress.setValue(0)
         self._progress.show()
         self._results_text.clear()
+        self._pending_text.clear()
         self._results = {}
 
         # Start worker
@@ -276,6 +447,7 @@ class OCRDialog(QDialog):
 
         self._progress_label.setText(f"Processing {len(pages)} pages...")
 
+    @pyqtSlot()
     def _cancel_ocr(self):
         """Cancel the OCR process."""
         if self._worker:
@@ -283,26 +455,49 @@ class OCRDialog(QDialog):
             self._worker.wait()
         self._on_finished(self._results)
 
+    @pyqtSlot(int, int)
     def _on_progress(self, current: int, total: int):
         """Update progress."""
         self._progress.setValue(current)
         self._progress_label.setText(f"Processing page {current} of {total}...")
 
+    @pyqtSlot(int, str)
     def _on_page_completed(self, page_idx: int, text: str):
         """Handle completed page."""
         self._results[page_idx] = text
 
-        # Append to results
-        self._results_text.append(f"--- Page {page_idx + 1} ---\n")
-        self._results_text.append(text if text else "(No text found)")
-        self._results_text.append("\n\n")
+        # Queue for the next batched flush into the results view
+        self._pending_text.append(
+            f"--- Page {page_idx + 1} ---\n\n"
+            f"{text if text else '(No text found)'}\n\n\n"
+        )
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(self.FLUSH_INTERVAL_MS, self._flush_pending)
+
+    @pyqtSlot()
+    def _flush_pending(self):
+        """Insert all queued page text with a single document edit."""
+        self._flush_scheduled = False
+        if not self._pending_text:
+            return
 
+        self._results_text.setUpdatesEnabled(False)
+        cursor = self._results_text.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText("".join(self._pending_text))
+        self._results_text.setUpdatesEnabled(True)
+        self._pending_text.clear()
+
+    @pyqtSlot(dict)
     def _on_finished(self, results: dict):
         """Handle OCR completion."""
+        self._flush_pending()
         self._results = results
         self._start_btn.setEnabled(True)
         self._cancel_btn.hide()
-        self._progress.hide()
+        if self._progress_bar:
+            self._progress_bar.hide()
         self._copy_btn.setEnabled(bool(results))
 
         total_text = sum(len(t) for t in results.values())
@@ -312,11 +507,22 @@ class OCRDialog(QDialog):
 
         log.info(f"OCR completed: {len(results)} pages processed")
 
+    @pyqtSlot(str)
     def _on_error(self, error: str):
         """Handle OCR error."""
         log.error(f"OCR error: {error}")
+        self._flush_pending()
         self._results_text.append(f"\nError: {error}\n")
 
+    def done(self, result: int):
+        """Stop background detection before the dialog goes away."""
+        self._start_after_scan = False
+        if self._scan_worker and self._scan_worker.isRunning():
+            self._scan_worker.cancel()
+            self._scan_worker.wait()
+        super().done(result)
+
+    @pyqtSlot()
     def _copy_text(self):
         """Copy extracted text to clipboard."""
         from PyQt6.QtWidgets import QApplication
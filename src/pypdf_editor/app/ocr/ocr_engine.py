@@ -1,5 +1,9 @@
 """OCR engine for text extraction - Phase 6 placeholder."""
 
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 
@@ -17,9 +21,50 @@ except ImportError:
     log.warning("pytesseract not available. OCR features disabled.")
 
 
+@lru_cache(maxsize=8)
+def _matrix_for_dpi(dpi: int):
+    """Get the render matrix for a DPI (cached)."""
+    import fitz
+    return fitz.Matrix(dpi / 72, dpi / 72)
+
+
+def ocr_page_job(
+    pdf_path: str,
+    page_idx: int,
+    dpi: Optional[int],
+    lang: str
+) -> tuple[int, str]:
+    """OCR a single page of a PDF file (runs inside a worker process)."""
+    import fitz
+    doc = fitz.open(pdf_path)
+    try:
+        text = OCREngine(lang).extract_text_from_page(doc[page_idx], dpi)
+        return page_idx, text
+    finally:
+        doc.close()
+
+
+def scan_pages_job(pdf_path: str, page_indices: list[int]) -> dict[int, bool]:
+    """Detect scanned pages of a PDF file (runs inside a worker process)."""
+    import fitz
+    engine = OCREngine()
+    doc = fitz.open(pdf_path)
+    try:
+        return {idx: engine.is_page_scanned(doc[idx]) for idx in page_indices}
+    finally:
+        doc.close()
+
+
 class OCREngine:
     """OCR engine using Tesseract."""
 
+    # Shared across dialog invocations; worker processes are costly to spawn
+    _pool: Optional[ProcessPoolExecutor] = None
+
+    # Render resolution bounds for adaptive DPI
+    MIN_DPI = 150
+    MAX_DPI = 300
+
     def __init__(self, language: str = "eng"):
         self._language = language
         self._available = TESSERACT_AVAILABLE
@@ -29,10 +74,36 @@ class OCREngine:
         """Check if OCR is available."""
         return self._available
 
+    @property
+    def language(self) -> str:
+        """Get the OCR language code."""
+        return self._language
+
     def set_language(self, language: str):
         """Set OCR language (e.g., 'eng', 'fra', 'deu')."""
         self._language = language
 
+    @classmethod
+    def get_pool(cls) -> ProcessPoolExecutor:
+        """Get the shared process pool for page-parallel OCR."""
+        if cls._pool is None:
+            # Windows caps process pools at 61 workers
+            workers = min(os.cpu_count() or 1, 61)
+            # Spawn rather than fork: the pool is first used from a QThread,
+            # and forking a multithreaded Qt process can deadlock
+            cls._pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return cls._pool
+
+    @classmethod
+    def shutdown_pool(cls):
+        """Shut down the shared process pool."""
+        if cls._pool is not None:
+            cls._pool.shutdown(wait=False, cancel_futures=True)
+            cls._pool = None
+
     def extract_text_from_image(self, image) -> str:
         """Extract text from a PIL Image."""
         if not self._available:
@@ -52,27 +123,59 @@ class OCREngine:
         if not page:
             return False
 
-        text = page.get_text().strip()
-        images = page.get_images()
+        # Image list is a cheap xref walk; pages without images can't be
+        # scans, so skip parsing the content stream for them
+        images = page.get_images(full=True)
+        if not images:
+            return False
 
-        # Heuristic: if page has images but very little text, likely scanned
-        if len(images) > 0 and len(text) < 50:
-            return True
-        return False
+        page._ocr_dpi_hint = self._estimate_image_dpi(page, images)
 
-    def extract_text_from_page(self, page, dpi: int = 300) -> str:
-        """Extract text from a PDF page using OCR."""
+        # Heuristic: if page has images but very little text, likely scanned
+        text = page.get_text("text", flags=0).strip()
+        return len(text) < 50
+
+    def _estimate_image_dpi(self, page, images: Optional[list] = None) -> float:
+        """Estimate the pixel density of the page's embedded images."""
+        if images is None:
+            images = page.get_images(full=True)
+
+        area_sq_in = (page.rect.width / 72) * (page.rect.height / 72)
+        if not images or area_sq_in <= 0:
+            return 0.0
+
+        # (xref, smask, width, height, ...) - assume images span the page
+        return max((img[2] * img[3] / area_sq_in) ** 0.5 for img in images)
+
+    def _adaptive_dpi(self, page) -> int:
+        """Pick a render DPI just above the native scan resolution."""
+        hint = getattr(page, "_ocr_dpi_hint", None)
+        if hint is None:
+            hint = self._estimate_image_dpi(page)
+        if not hint:
+            return self.MAX_DPI
+        return int(min(self.MAX_DPI, max(self.MIN_DPI, hint * 1.3)))
+
+    def extract_text_from_page(self, page, dpi: Optional[int] = None) -> str:
+        """Extract text from a PDF page using OCR.
+
+        When ``dpi`` is not given it is derived from the embedded images.
+        """
         if not self._available:
             return ""
 
         try:
-            # Render page to image
+            if dpi is None:
+                dpi = self._adaptive_dpi(page)
+
+            # Render page to grayscale - Tesseract converts to gray anyway
             import fitz
-            mat = fitz.Matrix(dpi / 72, dpi / 72)
-            pix = page.get_pixmap(matrix=mat)
+            pix = page.get_pixmap(matrix=_matrix_for_dpi(dpi), colorspace=fitz.csGRAY)
 
-            # Convert to PIL Image
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+            # Wrap the pixmap memory without copying; pix must outlive img
+            img = Image.frombuffer(
+                "L", (pix.width, pix.height), pix.samples_mv, "raw", "L", pix.stride, 1
+            )
 
             # Run OCR
             text = self.extract_text_from_image(img)
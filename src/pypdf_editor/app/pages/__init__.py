@@ -1,9 +1,14 @@
-"""Page operation modules."""
+"""Page operation modules.
 
-from .page_manager import PageManager
-from .merge_dialog import MergeDialog
-from .split_dialog import SplitDialog
-from .extract_dialog import ExtractDialog
+Submodules are imported on first attribute access.
+"""
+
+_LAZY_ATTRS = {
+    "PageManager": ".page_manager",
+    "MergeDialog": ".merge_dialog",
+    "SplitDialog": ".split_dialog",
+    "ExtractDialog": ".extract_dialog",
+}
 
 __all__ = [
     "PageManager",
@@ -11,3 +16,10 @@ __all__ = [
     "SplitDialog",
     "ExtractDialog",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        from importlib import import_module
+        return getattr(import_module(_LAZY_ATTRS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
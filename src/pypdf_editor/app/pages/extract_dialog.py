@@ -5,27 +5,83 @@ from typing import Optional
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
-    QLabel, QListWidget, QListWidgetItem, QCheckBox,
-    QMessageBox
+    QLabel, QListView, QCheckBox, QMessageBox
+)
+from PyQt6.QtCore import (
+    Qt, QAbstractListModel, QModelIndex, QThreadPool, QTimer, pyqtSlot
 )
-from PyQt6.QtCore import Qt
 
+from .workers import ExtractWorker
 from ..editor.pdf_document import PDFDocument
 from ..utils.file_io import get_save_path
+from ..styles import qss
 from ..utils.logger import get_logger
 
 log = get_logger("extract_dialog")
 
 
-class PageCheckItem(QListWidgetItem):
-    """List item with checkbox for page selection."""
+class PageCheckModel(QAbstractListModel):
+    """Checkable page list model storing one byte of state per page."""
+
+    def __init__(self, page_count: int, parent=None):
+        super().__init__(parent)
+        self._checked = bytearray(page_count)
+        self._checked_count = 0
+
+    @property
+    def checked_count(self) -> int:
+        """Get the number of checked pages."""
+        return self._checked_count
+
+    def checked_indices(self) -> list[int]:
+        """Get checked page indices in order."""
+        return [i for i, checked in enumerate(self._checked) if checked]
+
+    def set_all_checked(self, checked: bool):
+        """Check or uncheck every page with a single change notification."""
+        value = 1 if checked else 0
+        self._checked[:] = bytes([value]) * len(self._checked)
+        self._checked_count = len(self._checked) if checked else 0
+        if self._checked:
+            self.dataChanged.emit(
+                self.index(0), self.index(len(self._checked) - 1),
+                [Qt.ItemDataRole.CheckStateRole]
+            )
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._checked)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"Page {index.row() + 1}"
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if self._checked[index.row()] else Qt.CheckState.Unchecked
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        return (
+            Qt.ItemFlag.ItemIsUserCheckable
+            | Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemIsSelectable
+        )
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+
+        checked = 1 if Qt.CheckState(value) == Qt.CheckState.Checked else 0
+        row = index.row()
+        if self._checked[row] == checked:
+            return False
 
-    def __init__(self, page_index: int):
-        super().__init__()
-        self.page_index = page_index
-        self.setText(f"Page {page_index + 1}")
-        self.setFlags(self.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-        self.setCheckState(Qt.CheckState.Unchecked)
+        self._checked[row] = checked
+        self._checked_count += 1 if checked else -1
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        return True
 
 
 class ExtractDialog(QDialog):
@@ -34,6 +90,16 @@ class ExtractDialog(QDialog):
     def __init__(self, document: PDFDocument, parent=None):
         super().__init__(parent)
         self._document = document
+        self._worker: Optional[ExtractWorker] = None
+        self._busy = False
+        self._pending: Optional[tuple[list[int], Path]] = None
+
+        # Coalesce bursts of check changes into one label/button update
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._flush_count)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -47,7 +113,7 @@ class ExtractDialog(QDialog):
         instructions = QLabel(
             "Select pages to extract into a new PDF file."
         )
-        instructions.setStyleSheet("color: #8E8E93;")
+        instructions.setStyleSheet(qss("secondary_text"))
         layout.addWidget(instructions)
 
         # Select all / none buttons
@@ -63,29 +129,27 @@ class ExtractDialog(QDialog):
 
         select_row.addStretch()
 
-        self._count_label = QLabel("0 pages selected")
-        self._count_label.setStyleSheet("color: #8E8E93;")
+        self._count_label = QLabel()
+        self._count_label.setStyleSheet(qss("secondary_text"))
         select_row.addWidget(self._count_label)
 
         layout.addLayout(select_row)
 
-        # Page list
-        self._page_list = QListWidget()
+        # Page list - virtualized, only visible rows are realized
+        self._page_model = PageCheckModel(self._document.page_count, self)
+        self._page_list = QListView()
         self._page_list.setStyleSheet("""
-            QListWidget {
+            QListView {
                 border: 1px solid #E5E5E7;
                 border-radius: 8px;
             }
-            QListWidget::item {
+            QListView::item {
                 padding: 8px;
                 border-bottom: 1px solid #F0F0F2;
             }
         """)
-        self._page_list.itemChanged.connect(self._update_count)
-
-        # Add page items
-        for i in range(self._document.page_count):
-            self._page_list.addItem(PageCheckItem(i))
+        self._page_list.setUniformItemSizes(True)
+        self._page_list.setModel(self._page_model)
 
         layout.addWidget(self._page_list)
 
@@ -97,43 +161,43 @@ class ExtractDialog(QDialog):
         dialog_btns = QHBoxLayout()
         dialog_btns.addStretch()
 
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.clicked.connect(self.reject)
-        dialog_btns.addWidget(cancel_btn)
+        self._cancel_btn = QPushButton("Cancel")
+        self._cancel_btn.clicked.connect(self.reject)
+        dialog_btns.addWidget(self._cancel_btn)
 
         self._extract_btn = QPushButton("Extract")
         self._extract_btn.setObjectName("primaryButton")
         self._extract_btn.clicked.connect(self._do_extract)
-        self._extract_btn.setEnabled(False)
         dialog_btns.addWidget(self._extract_btn)
 
         layout.addLayout(dialog_btns)
 
+        # Track checks only once the widgets exist; initialize label once
+        self._page_model.dataChanged.connect(self._update_count)
+        self._flush_count()
+
     def _select_all(self):
         """Select all pages."""
-        for i in range(self._page_list.count()):
-            item = self._page_list.item(i)
-            item.setCheckState(Qt.CheckState.Checked)
+        self._page_model.set_all_checked(True)
 
     def _select_none(self):
         """Deselect all pages."""
-        for i in range(self._page_list.count()):
-            item = self._page_list.item(i)
-            item.setCheckState(Qt.CheckState.Unchecked)
+        self._page_model.set_all_checked(False)
 
     def _get_selected_indices(self) -> list[int]:
         """Get list of selected page indices."""
-        indices = []
-        for i in range(self._page_list.count()):
-            item = self._page_list.item(i)
-            if isinstance(item, PageCheckItem):
-                if item.checkState() == Qt.CheckState.Checked:
-                    indices.append(item.page_index)
-        return indices
+        return self._page_model.checked_indices()
 
+    @pyqtSlot()
     def _update_count(self):
+        """Schedule a selected count update."""
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    @pyqtSlot()
+    def _flush_count(self):
         """Update the selected count label."""
-        count = len(self._get_selected_indices())
+        count = self._page_model.checked_count
         self._count_label.setText(f"{count} page{'s' if count != 1 else ''} selected")
         self._extract_btn.setEnabled(count > 0)
 
@@ -153,41 +217,79 @@ class ExtractDialog(QDialog):
         if not output_path:
             return
 
-        try:
-            # Extract pages
-            pdf_bytes = self._document.extract_pages(indices)
-
-            if pdf_bytes:
-                Path(output_path).write_bytes(pdf_bytes)
-
-                # Optionally delete from original
-                if self._delete_after.isChecked():
-                    # Delete in reverse order to maintain indices
-                    for idx in sorted(indices, reverse=True):
-                        self._document.delete_page(idx)
-
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"Extracted {len(indices)} pages!\n\nSaved to: {output_path}"
-                )
-                self.accept()
-            else:
-                QMessageBox.critical(
-                    self,
-                    "Error",
-                    "Failed to extract pages."
-                )
+        # Extract in the background; deleting pages stays on this thread
+        self._pending = (indices, output_path)
+        self._worker = ExtractWorker(
+            self._document.snapshot(), indices, str(output_path)
+        )
+        self._set_busy(True)
+        self._worker.signals.finished.connect(self._on_extract_finished)
+        self._worker.signals.error.connect(self._on_extract_error)
+        QThreadPool.globalInstance().start(self._worker)
+
+    def _set_busy(self, busy: bool):
+        """Disable the dialog buttons while extraction is running."""
+        self._busy = busy
+        self._extract_btn.setEnabled(not busy and self._page_model.checked_count > 0)
+        self._cancel_btn.setEnabled(not busy)
+
+    def reject(self):
+        """Ignore Esc and Cancel while extraction is running."""
+        if self._busy:
+            return
+        super().reject()
 
-        except Exception as e:
+    def closeEvent(self, event):
+        """Keep the dialog open while extraction is running."""
+        if self._busy:
+            event.ignore()
+            return
+        super().closeEvent(event)
+
+    @pyqtSlot(object)
+    def _on_extract_finished(self, success: bool):
+        """Handle extraction completion."""
+        self._set_busy(False)
+        indices, output_path = self._pending
+
+        if not success:
             QMessageBox.critical(
                 self,
                 "Error",
-                f"Error extracting pages:\n{e}"
+                "Failed to extract pages."
             )
+            return
+
+        try:
+            # Optionally delete from original
+            if self._delete_after.isChecked():
+                self._document.delete_pages(indices)
+        except Exception as e:
+            self._on_extract_error(str(e))
+            return
+
+        QMessageBox.information(
+            self,
+            "Success",
+            f"Extracted {len(indices)} pages!\n\nSaved to: {output_path}"
+        )
+        self.accept()
+
+    @pyqtSlot(str)
+    def _on_extract_error(self, error: str):
+        """Handle extraction failure."""
+        self._set_busy(False)
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"Error extracting pages:\n{error}"
+        )
 
     def select_page(self, page_index: int):
         """Pre-select a specific page."""
-        if 0 <= page_index < self._page_list.count():
-            item = self._page_list.item(page_index)
-            item.setCheckState(Qt.CheckState.Checked)
+        if 0 <= page_index < self._page_model.rowCount():
+            self._page_model.setData(
+                self._page_model.index(page_index),
+                Qt.CheckState.Checked,
+                Qt.ItemDataRole.CheckStateRole
+            )
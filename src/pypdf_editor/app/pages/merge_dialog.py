@@ -8,10 +8,11 @@ from PyQt6.QtWidgets import (
     QListWidget, QListWidgetItem, QLabel, QFileDialog,
     QProgressBar, QMessageBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThreadPool, pyqtSlot
 
-from ..editor.pdf_document import PDFDocument
+from .workers import MergeWorker
 from ..utils.file_io import get_save_path
+from ..styles import qss
 from ..utils.logger import get_logger
 
 log = get_logger("merge_dialog")
@@ -32,6 +33,10 @@ class MergeDialog(QDialog):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._worker: Optional[MergeWorker] = None
+        self._busy = False
+        self._output_path = None
+        self._paths: dict[str, None] = {}  # ordered set of added files
         self._setup_ui()
 
     def _setup_ui(self):
@@ -47,7 +52,7 @@ class MergeDialog(QDialog):
             "Files will be merged in the order shown."
         )
         instructions.setWordWrap(True)
-        instructions.setStyleSheet("color: #8E8E93;")
+        instructions.setStyleSheet(qss("secondary_text"))
         layout.addWidget(instructions)
 
         # File list
@@ -67,6 +72,7 @@ class MergeDialog(QDialog):
                 background-color: #E5F2FF;
             }
         """)
+        self._file_list.model().rowsMoved.connect(self._sync_paths_order)
         layout.addWidget(self._file_list)
 
         # Add/Remove buttons
@@ -96,9 +102,9 @@ class MergeDialog(QDialog):
         dialog_btns = QHBoxLayout()
         dialog_btns.addStretch()
 
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.clicked.connect(self.reject)
-        dialog_btns.addWidget(cancel_btn)
+        self._cancel_btn = QPushButton("Cancel")
+        self._cancel_btn.clicked.connect(self.reject)
+        dialog_btns.addWidget(self._cancel_btn)
 
         self._merge_btn = QPushButton("Merge")
         self._merge_btn.setObjectName("primaryButton")
@@ -117,31 +123,40 @@ class MergeDialog(QDialog):
             "PDF Files (*.pdf)"
         )
 
-        for path in paths:
-            # Check if already added
-            exists = False
-            for i in range(self._file_list.count()):
-                item = self._file_list.item(i)
-                if isinstance(item, PDFListItem) and item.file_path == path:
-                    exists = True
-                    break
+        # Skip files already added
+        new_paths = [path for path in dict.fromkeys(paths) if path not in self._paths]
+        self._paths.update(dict.fromkeys(new_paths))
 
-            if not exists:
+        # Insert all rows with view updates suspended
+        self._file_list.setUpdatesEnabled(False)
+        try:
+            for path in new_paths:
                 self._file_list.addItem(PDFListItem(path))
+        finally:
+            self._file_list.setUpdatesEnabled(True)
 
         self._update_merge_button()
 
     def _remove_selected(self):
         """Remove selected files from the list."""
         for item in self._file_list.selectedItems():
+            self._paths.pop(item.file_path, None)
             self._file_list.takeItem(self._file_list.row(item))
         self._update_merge_button()
 
     def _clear_all(self):
         """Clear all files from the list."""
         self._file_list.clear()
+        self._paths.clear()
         self._update_merge_button()
 
+    @pyqtSlot()
+    def _sync_paths_order(self):
+        """Rebuild the ordered path set after a drag reorder."""
+        self._paths = dict.fromkeys(
+            self._file_list.item(i).file_path for i in range(self._file_list.count())
+        )
+
     def _update_merge_button(self):
         """Update merge button state."""
         self._merge_btn.setEnabled(self._file_list.count() >= 2)
@@ -160,43 +175,77 @@ class MergeDialog(QDialog):
         if not output_path:
             return
 
-        # Collect file paths in order
-        paths = []
-        for i in range(self._file_list.count()):
-            item = self._file_list.item(i)
-            if isinstance(item, PDFListItem):
-                paths.append(item.file_path)
+        # Kept in list order by add/remove/clear and drag reordering
+        paths = list(self._paths)
 
         # Show progress
         self._progress.setMaximum(len(paths))
         self._progress.setValue(0)
         self._progress.show()
+        self._set_busy(True)
+
+        # Perform merge in the background
+        self._output_path = output_path
+        self._worker = MergeWorker(paths, str(output_path))
+        self._worker.signals.progress.connect(self._progress.setValue)
+        self._worker.signals.finished.connect(self._on_merge_finished)
+        self._worker.signals.error.connect(self._on_merge_error)
+        QThreadPool.globalInstance().start(self._worker)
+
+    def _set_busy(self, busy: bool):
+        """Disable the dialog buttons while a merge is running."""
+        self._busy = busy
+        self._merge_btn.setEnabled(not busy and self._file_list.count() >= 2)
+        self._cancel_btn.setEnabled(not busy)
+
+    def reject(self):
+        """Ignore Esc and Cancel while a merge is running."""
+        if self._busy:
+            return
+        super().reject()
 
-        # Perform merge
-        try:
-            if PDFDocument.merge_pdfs(paths, str(output_path)):
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"PDFs merged successfully!\n\nSaved to: {output_path}"
-                )
-                self.accept()
-            else:
-                QMessageBox.critical(
-                    self,
-                    "Error",
-                    "Failed to merge PDFs."
-                )
-        except Exception as e:
+    def closeEvent(self, event):
+        """Keep the dialog open while a merge is running."""
+        if self._busy:
+            event.ignore()
+            return
+        super().closeEvent(event)
+
+    @pyqtSlot(object)
+    def _on_merge_finished(self, success: bool):
+        """Handle merge completion."""
+        self._progress.hide()
+        self._set_busy(False)
+
+        if success:
+            QMessageBox.information(
+                self,
+                "Success",
+                f"PDFs merged successfully!\n\nSaved to: {self._output_path}"
+            )
+            self.accept()
+        else:
             QMessageBox.critical(
                 self,
                 "Error",
-                f"Error merging PDFs:\n{e}"
+                "Failed to merge PDFs."
             )
-        finally:
-            self._progress.hide()
+
+    @pyqtSlot(str)
+    def _on_merge_error(self, error: str):
+        """Handle merge failure."""
+        self._progress.hide()
+        self._set_busy(False)
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"Error merging PDFs:\n{error}"
+        )
 
     def add_file(self, path: str):
         """Add a file to the merge list."""
+        if path in self._paths:
+            return
+        self._paths[path] = None
         self._file_list.addItem(PDFListItem(path))
         self._update_merge_button()
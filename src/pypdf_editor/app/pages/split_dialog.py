@@ -1,20 +1,27 @@
 """Dialog for splitting PDF into multiple files."""
 
+import re
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
+import fitz  # PyMuPDF
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
     QLabel, QSpinBox, QRadioButton, QButtonGroup,
-    QLineEdit, QProgressBar, QMessageBox, QFileDialog
+    QLineEdit, QProgressBar, QMessageBox, QFileDialog, QCheckBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThreadPool, pyqtSlot
 
+from .workers import SplitWorker
 from ..editor.pdf_document import PDFDocument
+from ..styles import qss
 from ..utils.logger import get_logger
 
 log = get_logger("split_dialog")
 
+# One comma-separated page range: "N" or "N-M"
+_RANGE_RE = re.compile(r"\s*(\d+)\s*(?:-\s*(\d+))?\s*")
+
 
 class SplitDialog(QDialog):
     """Dialog for splitting a PDF file."""
@@ -22,6 +29,11 @@ class SplitDialog(QDialog):
     def __init__(self, document: PDFDocument, parent=None):
         super().__init__(parent)
         self._document = document
+        # Fixed while the dialog is open
+        self._page_count = document.page_count
+        self._worker: Optional[SplitWorker] = None
+        self._busy = False
+        self._output_dir = ""
         self._setup_ui()
 
     def _setup_ui(self):
@@ -36,15 +48,15 @@ class SplitDialog(QDialog):
         info.setStyleSheet("font-weight: bold;")
         layout.addWidget(info)
 
-        pages_info = QLabel(f"Total pages: {self._document.page_count}")
-        pages_info.setStyleSheet("color: #8E8E93;")
+        pages_info = QLabel(f"Total pages: {self._page_count}")
+        pages_info.setStyleSheet(qss("secondary_text"))
         layout.addWidget(pages_info)
 
         layout.addSpacing(10)
 
         # Split mode selection
         mode_label = QLabel("Split mode:")
-        mode_label.setStyleSheet("font-weight: 600;")
+        mode_label.setStyleSheet(qss("section_label"))
         layout.addWidget(mode_label)
 
         self._mode_group = QButtonGroup(self)
@@ -58,7 +70,7 @@ class SplitDialog(QDialog):
 
         self._pages_spin = QSpinBox()
         self._pages_spin.setMinimum(1)
-        self._pages_spin.setMaximum(self._document.page_count)
+        self._pages_spin.setMaximum(self._page_count)
         self._pages_spin.setValue(1)
         every_n_row.addWidget(self._pages_spin)
 
@@ -74,7 +86,7 @@ class SplitDialog(QDialog):
 
         self._files_spin = QSpinBox()
         self._files_spin.setMinimum(2)
-        self._files_spin.setMaximum(self._document.page_count)
+        self._files_spin.setMaximum(self._page_count)
         self._files_spin.setValue(2)
         into_n_row.addWidget(self._files_spin)
 
@@ -94,16 +106,10 @@ class SplitDialog(QDialog):
         self._ranges_input.setEnabled(False)
         layout.addWidget(self._ranges_input)
 
-        # Connect radio buttons to enable/disable inputs
-        self._every_n_radio.toggled.connect(
-            lambda c: self._pages_spin.setEnabled(c)
-        )
-        self._into_n_radio.toggled.connect(
-            lambda c: self._files_spin.setEnabled(c)
-        )
-        self._ranges_radio.toggled.connect(
-            lambda c: self._ranges_input.setEnabled(c)
-        )
+        # Connect radio buttons straight to enable/disable inputs
+        self._every_n_radio.toggled.connect(self._pages_spin.setEnabled)
+        self._into_n_radio.toggled.connect(self._files_spin.setEnabled)
+        self._ranges_radio.toggled.connect(self._ranges_input.setEnabled)
 
         layout.addSpacing(10)
 
@@ -122,6 +128,10 @@ class SplitDialog(QDialog):
 
         layout.addLayout(output_row)
 
+        # Full garbage collection + deflate; noticeably slower on large files
+        self._compact_check = QCheckBox("Compact output (slower)")
+        layout.addWidget(self._compact_check)
+
         # Progress bar
         self._progress = QProgressBar()
         self._progress.hide()
@@ -131,9 +141,9 @@ class SplitDialog(QDialog):
         dialog_btns = QHBoxLayout()
         dialog_btns.addStretch()
 
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.clicked.connect(self.reject)
-        dialog_btns.addWidget(cancel_btn)
+        self._cancel_btn = QPushButton("Cancel")
+        self._cancel_btn.clicked.connect(self.reject)
+        dialog_btns.addWidget(self._cancel_btn)
 
         self._split_btn = QPushButton("Split")
         self._split_btn.setObjectName("primaryButton")
@@ -163,79 +173,164 @@ class SplitDialog(QDialog):
             return
 
         mode = self._mode_group.checkedId()
+        total_pages = self._page_count
+        fast = not self._compact_check.isChecked()
+
+        if mode == 2:
+            # Custom ranges - parse here, split in the worker
+            try:
+                ranges = self._parse_ranges(self._ranges_input.text())
+            except ValueError as e:
+                QMessageBox.warning(self, "Invalid Page Ranges", str(e))
+                return
+            if not ranges:
+                QMessageBox.warning(
+                    self,
+                    "Invalid Page Ranges",
+                    "Please enter page ranges, e.g. 1-3, 4-6."
+                )
+                return
+            file_count = len(ranges)
 
-        try:
-            self._progress.show()
-
+            def split_fn(document, progress):
+                return self._split_by_ranges(
+                    document, output_dir, ranges, progress, fast=fast
+                )
+        else:
             if mode == 0:
                 # Split every N pages
                 pages_per_file = self._pages_spin.value()
-                result = self._document.split_by_pages(output_dir, pages_per_file)
-
-            elif mode == 1:
+            else:
                 # Split into N equal files
                 num_files = self._files_spin.value()
-                total_pages = self._document.page_count
                 pages_per_file = max(1, total_pages // num_files)
-                result = self._document.split_by_pages(output_dir, pages_per_file)
-
-            else:
-                # Custom ranges - parse and split
-                ranges_text = self._ranges_input.text()
-                result = self._split_by_ranges(output_dir, ranges_text)
+            file_count = -(-total_pages // pages_per_file)
 
-            if result:
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"PDF split into {len(result)} files!\n\n"
-                    f"Saved to: {output_dir}"
-                )
-                self.accept()
-            else:
-                QMessageBox.critical(
-                    self,
-                    "Error",
-                    "Failed to split PDF."
+            def split_fn(document, progress):
+                return document.split_by_pages(
+                    output_dir, pages_per_file, progress, fast=fast
                 )
 
-        except Exception as e:
+        self._output_dir = output_dir
+        self._progress.setMaximum(max(1, file_count))
+        self._progress.setValue(0)
+        self._progress.show()
+        self._worker = SplitWorker(self._document.snapshot(), split_fn)
+        self._set_busy(True)
+        self._worker.signals.progress.connect(self._progress.setValue)
+        self._worker.signals.finished.connect(self._on_split_finished)
+        self._worker.signals.error.connect(self._on_split_error)
+        QThreadPool.globalInstance().start(self._worker)
+
+    def _set_busy(self, busy: bool):
+        """Disable the dialog buttons while a split is running."""
+        self._busy = busy
+        self._split_btn.setEnabled(not busy)
+        self._cancel_btn.setEnabled(not busy)
+
+    def reject(self):
+        """Ignore Esc and Cancel while a split is running."""
+        if self._busy:
+            return
+        super().reject()
+
+    def closeEvent(self, event):
+        """Keep the dialog open while a split is running."""
+        if self._busy:
+            event.ignore()
+            return
+        super().closeEvent(event)
+
+    @pyqtSlot(object)
+    def _on_split_finished(self, result: list[str]):
+        """Handle split completion."""
+        self._progress.hide()
+        self._set_busy(False)
+
+        if result:
+            QMessageBox.information(
+                self,
+                "Success",
+                f"PDF split into {len(result)} files!\n\n"
+                f"Saved to: {self._output_dir}"
+            )
+            self.accept()
+        else:
             QMessageBox.critical(
                 self,
                 "Error",
-                f"Error splitting PDF:\n{e}"
+                "Failed to split PDF."
             )
-        finally:
-            self._progress.hide()
 
-    def _split_by_ranges(self, output_dir: str, ranges_text: str) -> list[str]:
+    @pyqtSlot(str)
+    def _on_split_error(self, error: str):
+        """Handle split failure."""
+        self._progress.hide()
+        self._set_busy(False)
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"Error splitting PDF:\n{error}"
+        )
+
+    def _split_by_ranges(
+        self,
+        document: PDFDocument,
+        output_dir: str,
+        ranges: list[tuple[int, int]],
+        progress: Optional[Callable[[int], None]] = None,
+        fast: bool = True
+    ) -> list[str]:
         """Split PDF by custom page ranges."""
-        import fitz
+        src = document.raw_doc
+        if src is None:
+            return []
 
+        name = document.path.stem if document.path else "split"
         output_paths = []
-        ranges = self._parse_ranges(ranges_text)
 
         for i, (start, end) in enumerate(ranges, 1):
-            indices = list(range(start - 1, end))  # Convert to 0-based
-            pdf_bytes = self._document.extract_pages(indices)
-
-            if pdf_bytes:
-                name = self._document.path.stem if self._document.path else "split"
-                out_file = Path(output_dir) / f"{name}_pages_{start}-{end}.pdf"
-                out_file.write_bytes(pdf_bytes)
+            out_file = Path(output_dir) / f"{name}_pages_{start}-{end}.pdf"
+
+            # Copy the whole contiguous range in one native call
+            dst = fitz.open()
+            try:
+                dst.insert_pdf(src, from_page=start - 1, to_page=end - 1)
+                if fast:
+                    dst.save(str(out_file), garbage=0, deflate=False)
+                else:
+                    dst.save(str(out_file), garbage=4, deflate=True)
                 output_paths.append(str(out_file))
+            except Exception as e:
+                log.error(f"Failed to write pages {start}-{end}: {e}")
+            finally:
+                dst.close()
+
+            if progress:
+                progress(i)
 
         return output_paths
 
     def _parse_ranges(self, text: str) -> list[tuple[int, int]]:
-        """Parse page ranges from text like '1-3, 4-6, 7-10'."""
+        """Parse page ranges from text like '1-3, 4-6, 7-10'.
+
+        Raises ValueError for malformed, reversed or out-of-range pieces.
+        """
+        page_count = self._page_count
         ranges = []
-        for part in text.split(','):
-            part = part.strip()
-            if '-' in part:
-                start, end = part.split('-', 1)
-                ranges.append((int(start.strip()), int(end.strip())))
-            elif part.isdigit():
-                page = int(part)
-                ranges.append((page, page))
+        for part in text.split(","):
+            if not part.strip():
+                continue
+            m = _RANGE_RE.fullmatch(part)
+            if m is None:
+                raise ValueError(f"'{part.strip()}' is not a page or page range.")
+            start = int(m.group(1))
+            end = int(m.group(2) or m.group(1))
+            if start > end:
+                raise ValueError(f"Range {start}-{end} is reversed.")
+            if start < 1 or end > page_count:
+                raise ValueError(
+                    f"Range {part.strip()} is outside pages 1-{page_count}."
+                )
+            ranges.append((start, end))
         return ranges
@@ -0,0 +1,92 @@
+"""Background workers for page operations (merge, split, extract)."""
+
+from typing import Any, Callable
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from ..editor.pdf_document import DocumentSnapshot, PDFDocument
+from ..utils.logger import get_logger
+
+log = get_logger("page_workers")
+
+
+class WorkerSignals(QObject):
+    """Signals for page operation workers."""
+
+    progress = pyqtSignal(int)  # completed steps
+    finished = pyqtSignal(object)  # result
+    error = pyqtSignal(str)
+
+
+class PageOpWorker(QRunnable):
+    """Base runnable that reports a page operation's result via signals."""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            result = self._work(self.signals.progress.emit)
+        except Exception as e:
+            log.error(f"{type(self).__name__} failed: {e}")
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+    def _work(self, progress: Callable[[int], None]) -> Any:
+        """Do the work; override in subclasses."""
+        raise NotImplementedError
+
+
+class MergeWorker(PageOpWorker):
+    """Merges PDF files into one output file."""
+
+    def __init__(self, paths: list[str], output_path: str):
+        super().__init__()
+        self._paths = paths
+        self._output_path = output_path
+
+    def _work(self, progress: Callable[[int], None]) -> bool:
+        return PDFDocument.merge_pdfs(self._paths, self._output_path, progress)
+
+
+class ExtractWorker(PageOpWorker):
+    """Extracts pages of a document snapshot into a new file."""
+
+    def __init__(self, snapshot: DocumentSnapshot, indices: list[int], output_path: str):
+        super().__init__()
+        self._snapshot = snapshot
+        self._indices = indices
+        self._output_path = output_path
+
+    def _work(self, progress: Callable[[int], None]) -> bool:
+        document = self._snapshot.open()
+        try:
+            return document.extract_pages_to(self._indices, self._output_path)
+        finally:
+            document.close()
+
+
+class SplitWorker(PageOpWorker):
+    """Runs a split function on a document snapshot.
+
+    ``split_fn`` is called with the opened document and a progress callback
+    and returns the written file paths.
+    """
+
+    def __init__(
+        self,
+        snapshot: DocumentSnapshot,
+        split_fn: Callable[[PDFDocument, Callable[[int], None]], list[str]]
+    ):
+        super().__init__()
+        self._snapshot = snapshot
+        self._split_fn = split_fn
+
+    def _work(self, progress: Callable[[int], None]) -> list[str]:
+        document = self._snapshot.open()
+        try:
+            return self._split_fn(document, progress)
+        finally:
+            document.close()
@@ -1,5 +1,13 @@
 """Professional styling for PyPDF Editor - macOS Big Sur+ inspired."""
 
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PyQt6.QtGui import QColor
+    from PyQt6.QtWidgets import QApplication
+
 # macOS Big Sur+ Color Palette
 MACOS_COLORS = {
     # Primary colors
@@ -71,24 +79,47 @@ MACOS_RADIUS = {
     "pill": "999px",
 }
 
-# Main theme stylesheet
-THEME = f"""
+
+def _build_theme() -> str:
+    """Build the main theme stylesheet from the palette."""
+    # Bind palette entries to locals once instead of indexing per use
+    bg_main = MACOS_COLORS["bg_main"]
+    text_primary = MACOS_COLORS["text_primary"]
+    bg_white = MACOS_COLORS["bg_white"]
+    border_light = MACOS_COLORS["border_light"]
+    bg_hover = MACOS_COLORS["bg_hover"]
+    primary = MACOS_COLORS["primary"]
+    text_light = MACOS_COLORS["text_light"]
+    border = MACOS_COLORS["border"]
+    border_dark = MACOS_COLORS["border_dark"]
+    text_tertiary = MACOS_COLORS["text_tertiary"]
+    primary_hover = MACOS_COLORS["primary_hover"]
+    primary_light = MACOS_COLORS["primary_light"]
+    primary_ultra_light = MACOS_COLORS["primary_ultra_light"]
+    text_secondary = MACOS_COLORS["text_secondary"]
+    bg_canvas = MACOS_COLORS["bg_canvas"]
+    bg_translucent_dark = MACOS_COLORS["bg_translucent_dark"]
+    radius_small = MACOS_RADIUS["small"]
+    radius_medium = MACOS_RADIUS["medium"]
+    radius_pill = MACOS_RADIUS["pill"]
+
+    return f"""
 /* ========== MAIN WINDOW ========== */
 QMainWindow {{
-    background-color: {MACOS_COLORS['bg_main']};
+    background-color: {bg_main};
 }}
 
 QWidget {{
     background-color: transparent;
-    color: {MACOS_COLORS['text_primary']};
+    color: {text_primary};
     font-family: -apple-system, 'SF Pro Display', 'Segoe UI', sans-serif;
     font-size: 13px;
 }}
 
 /* ========== MENU BAR ========== */
 QMenuBar {{
-    background-color: {MACOS_COLORS['bg_white']};
-    border-bottom: 1px solid {MACOS_COLORS['border_light']};
+    background-color: {bg_white};
+    border-bottom: 1px solid {border_light};
     padding: 2px 8px;
     font-size: 13px;
 }}
@@ -96,109 +127,109 @@ QMenuBar {{
 QMenuBar::item {{
     background-color: transparent;
     padding: 8px 12px;
-    border-radius: {MACOS_RADIUS['small']};
+    border-radius: {radius_small};
     margin: 2px;
 }}
 
 QMenuBar::item:selected {{
-    background-color: {MACOS_COLORS['bg_hover']};
+    background-color: {bg_hover};
 }}
 
 QMenu {{
-    background-color: {MACOS_COLORS['bg_white']};
+    background-color: {bg_white};
     border: none;
-    border-radius: {MACOS_RADIUS['medium']};
+    border-radius: {radius_medium};
     padding: 8px;
 }}
 
 QMenu::item {{
     padding: 10px 40px 10px 16px;
-    border-radius: {MACOS_RADIUS['small']};
+    border-radius: {radius_small};
     margin: 2px 4px;
 }}
 
 QMenu::item:selected {{
-    background-color: {MACOS_COLORS['primary']};
-    color: {MACOS_COLORS['text_light']};
+    background-color: {primary};
+    color: {text_light};
 }}
 
 QMenu::separator {{
     height: 1px;
-    background-color: {MACOS_COLORS['border_light']};
+    background-color: {border_light};
     margin: 8px 12px;
 }}
 
 /* ========== BUTTONS ========== */
 QPushButton {{
-    background-color: {MACOS_COLORS['bg_white']};
-    color: {MACOS_COLORS['text_primary']};
-    border: 1px solid {MACOS_COLORS['border']};
-    border-radius: {MACOS_RADIUS['medium']};
+    background-color: {bg_white};
+    color: {text_primary};
+    border: 1px solid {border};
+    border-radius: {radius_medium};
     padding: 10px 20px;
     font-weight: 500;
     font-size: 13px;
 }}
 
 QPushButton:hover {{
-    background-color: {MACOS_COLORS['bg_hover']};
-    border-color: {MACOS_COLORS['border_dark']};
+    background-color: {bg_hover};
+    border-color: {border_dark};
 }}
 
 QPushButton:pressed {{
-    background-color: {MACOS_COLORS['border']};
+    background-color: {border};
 }}
 
 QPushButton:disabled {{
-    background-color: {MACOS_COLORS['bg_main']};
-    color: {MACOS_COLORS['text_tertiary']};
-    border-color: {MACOS_COLORS['border_light']};
+    background-color: {bg_main};
+    color: {text_tertiary};
+    border-color: {border_light};
 }}
 
 QPushButton[class="primary"], QPushButton#primaryButton {{
-    background-color: {MACOS_COLORS['primary']};
-    color: {MACOS_COLORS['text_light']};
+    background-color: {primary};
+    color: {text_light};
     border: none;
     font-weight: 600;
 }}
 
 QPushButton[class="primary"]:hover, QPushButton#primaryButton:hover {{
-    background-color: {MACOS_COLORS['primary_hover']};
+    background-color: {primary_hover};
 }}
 
 /* ========== TOOL BUTTONS ========== */
 QToolButton {{
     background-color: transparent;
     border: none;
-    border-radius: {MACOS_RADIUS['small']};
+    border-radius: {radius_small};
     padding: 8px 14px;
-    color: {MACOS_COLORS['text_primary']};
+    color: {text_primary};
     font-weight: 500;
     font-size: 13px;
 }}
 
 QToolButton:hover {{
-    background-color: {MACOS_COLORS['bg_hover']};
+    background-color: {bg_hover};
 }}
 
 QToolButton:pressed {{
-    background-color: {MACOS_COLORS['border']};
+    background-color: {border};
 }}
 
 QToolButton:checked {{
-    background-color: {MACOS_COLORS['primary_light']};
-    color: {MACOS_COLORS['primary']};
+    background-color: {primary_light};
+    color: {primary};
 }}
 
 /* ========== TOOLBARS ========== */
 QToolBar {{
-    background-color: {MACOS_COLORS['bg_white']};
-    border-bottom: 1px solid {MACOS_COLORS['border_light']};
+    background-color: {bg_white};
+    border-bottom: 1px solid {border_light};
     padding: 8px 12px;
     spacing: 8px;
 }}
 
 QToolBar::separator {{
-    background-color: {MACOS_COLORS['border_light']};
+    background-color: {border_light};
     width: 1px;
     margin: 8px;
 }}
@@ -206,22 +237,22 @@ QToolBar::separator {{
 /* ========== LABELS ========== */
 QLabel {{
     background-color: transparent;
-    color: {MACOS_COLORS['text_primary']};
+    color: {text_primary};
 }}
 
 /* ========== INPUT FIELDS ========== */
 QLineEdit {{
-    background-color: {MACOS_COLORS['bg_white']};
-    border: 1px solid {MACOS_COLORS['border']};
-    border-radius: {MACOS_RADIUS['medium']};
+    background-color: {bg_white};
+    border: 1px solid {border};
+    border-radius: {radius_medium};
     padding: 10px 14px;
-    color: {MACOS_COLORS['text_primary']};
+    color: {text_primary};
     font-size: 13px;
-    selection-background-color: {MACOS_COLORS['primary']};
+    selection-background-color: {primary};
 }}
 
 QLineEdit:focus {{
-    border-color: {MACOS_COLORS['primary']};
+    border-color: {primary};
     border-width: 2px;
     padding: 9px 13px;
 }}
@@ -235,13 +266,13 @@ QScrollBar:vertical {{
 }}
 
 QScrollBar::handle:vertical {{
-    background-color: {MACOS_COLORS['border']};
+    background-color: {border};
     border-radius: 6px;
     min-height: 40px;
 }}
 
 QScrollBar::handle:vertical:hover {{
-    background-color: {MACOS_COLORS['border_dark']};
+    background-color: {border_dark};
 }}
 
 QScrollBar:horizontal {{
@@ -252,13 +283,13 @@ QScrollBar:horizontal {{
 }}
 
 QScrollBar::handle:horizontal {{
-    background-color: {MACOS_COLORS['border']};
+    background-color: {border};
     border-radius: 6px;
     min-width: 40px;
 }}
 
 QScrollBar::handle:horizontal:hover {{
-    background-color: {MACOS_COLORS['border_dark']};
+    background-color: {border_dark};
 }}
 
 QScrollBar::add-line, QScrollBar::sub-line {{
@@ -272,52 +303,52 @@ QScrollBar::add-page, QScrollBar::sub-page {{
 
 /* ========== LIST WIDGET (for thumbnails) ========== */
 QListWidget {{
-    background-color: {MACOS_COLORS['bg_main']};
+    background-color: {bg_main};
     border: none;
     outline: none;
 }}
 
 QListWidget::item {{
-    background-color: {MACOS_COLORS['bg_white']};
+    background-color: {bg_white};
     border: 2px solid transparent;
-    border-radius: {MACOS_RADIUS['small']};
+    border-radius: {radius_small};
     margin: 4px;
     padding: 4px;
 }}
 
 QListWidget::item:selected {{
-    border-color: {MACOS_COLORS['primary']};
-    background-color: {MACOS_COLORS['primary_ultra_light']};
+    border-color: {primary};
+    background-color: {primary_ultra_light};
 }}
 
 QListWidget::item:hover:!selected {{
-    background-color: {MACOS_COLORS['bg_hover']};
+    background-color: {bg_hover};
 }}
 
 /* ========== TREE WIDGET (for outline/bookmarks) ========== */
 QTreeWidget {{
-    background-color: {MACOS_COLORS['bg_white']};
+    background-color: {bg_white};
     border: none;
     outline: none;
 }}
 
 QTreeWidget::item {{
     padding: 8px 4px;
-    border-radius: {MACOS_RADIUS['small']};
+    border-radius: {radius_small};
 }}
 
 QTreeWidget::item:selected {{
-    background-color: {MACOS_COLORS['primary']};
-    color: {MACOS_COLORS['text_light']};
+    background-color: {primary};
+    color: {text_light};
 }}
 
 QTreeWidget::item:hover:!selected {{
-    background-color: {MACOS_COLORS['bg_hover']};
+    background-color: {bg_hover};
 }}
 
 /* ========== SPLITTER ========== */
 QSplitter::handle {{
-    background-color: {MACOS_COLORS['border_light']};
+    background-color: {border_light};
 }}
 
 QSplitter::handle:horizontal {{
@@ -330,85 +361,120 @@ QSplitter::handle:vertical {{
 
 /* ========== STATUS BAR ========== */
 QStatusBar {{
-    background-color: {MACOS_COLORS['bg_white']};
-    border-top: 1px solid {MACOS_COLORS['border_light']};
-    color: {MACOS_COLORS['text_secondary']};
+    background-color: {bg_white};
+    border-top: 1px solid {border_light};
+    color: {text_secondary};
     padding: 8px 16px;
     font-size: 12px;
 }}
 
 /* ========== GRAPHICS VIEW (PDF Canvas) ========== */
 QGraphicsView {{
-    background-color: {MACOS_COLORS['bg_canvas']};
+    background-color: {bg_canvas};
     border: none;
 }}
 
 /* ========== PROGRESS BAR ========== */
 QProgressBar {{
-    background-color: {MACOS_COLORS['bg_main']};
+    background-color: {bg_main};
     border: none;
-    border-radius: {MACOS_RADIUS['pill']};
+    border-radius: {radius_pill};
     height: 8px;
     text-align: center;
 }}
 
 QProgressBar::chunk {{
-    background-color: {MACOS_COLORS['primary']};
-    border-radius: {MACOS_RADIUS['pill']};
+    background-color: {primary};
+    border-radius: {radius_pill};
 }}
 
 /* ========== DIALOG ========== */
 QDialog {{
-    background-color: {MACOS_COLORS['bg_main']};
+    background-color: {bg_main};
 }}
 
 /* ========== SPIN BOX ========== */
 QSpinBox, QDoubleSpinBox {{
-    background-color: {MACOS_COLORS['bg_white']};
-    border: 1px solid {MACOS_COLORS['border']};
-    border-radius: {MACOS_RADIUS['small']};
+    background-color: {bg_white};
+    border: 1px solid {border};
+    border-radius: {radius_small};
     padding: 6px 10px;
-    color: {MACOS_COLORS['text_primary']};
+    color: {text_primary};
 }}
 
 QSpinBox:focus, QDoubleSpinBox:focus {{
-    border-color: {MACOS_COLORS['primary']};
+    border-color: {primary};
 }}
 
 /* ========== COMBO BOX ========== */
 QComboBox {{
-    background-color: {MACOS_COLORS['bg_white']};
-    border: 1px solid {MACOS_COLORS['border']};
-    border-radius: {MACOS_RADIUS['small']};
+    background-color: {bg_white};
+    border: 1px solid {border};
+    border-radius: {radius_small};
     padding: 8px 12px;
     padding-right: 30px;
-    color: {MACOS_COLORS['text_primary']};
+    color: {text_primary};
 }}
 
 QComboBox:hover {{
-    border-color: {MACOS_COLORS['border_dark']};
+    border-color: {border_dark};
 }}
 
 QComboBox:focus {{
-    border-color: {MACOS_COLORS['primary']};
+    border-color: {primary};
 }}
 
 QComboBox QAbstractItemView {{
-    background-color: {MACOS_COLORS['bg_white']};
+    background-color: {bg_white};
     border: none;
-    border-radius: {MACOS_RADIUS['medium']};
+    border-radius: {radius_medium};
     padding: 6px;
-    selection-background-color: {MACOS_COLORS['primary']};
-    selection-color: {MACOS_COLORS['text_light']};
+    selection-background-color: {primary};
+    selection-color: {text_light};
 }}
 
 /* ========== TOOLTIPS ========== */
 QToolTip {{
-    background-color: {MACOS_COLORS['bg_translucent_dark']};
-    color: {MACOS_COLORS['text_light']};
+    background-color: {bg_translucent_dark};
+    color: {text_light};
     border: none;
-    border-radius: {MACOS_RADIUS['small']};
+    border-radius: {radius_small};
     padding: 10px 14px;
     font-size: 12px;
 }}
 """
+
+
+# Small per-widget stylesheet fragments, keyed by semantic name
+_QSS_FRAGMENTS = {
+    "secondary_text": f"color: {MACOS_COLORS['text_secondary']};",
+    "section_label": "font-weight: 600;",
+}
+_QSS_CACHE: dict[str, str] = {}
+
+
+def qss(name: str) -> str:
+    """Get a named stylesheet fragment, interned so repeats share one string."""
+    fragment = _QSS_CACHE.get(name)
+    if fragment is None:
+        fragment = _QSS_CACHE[name] = sys.intern(_QSS_FRAGMENTS[name])
+    return fragment
+
+
+@lru_cache(maxsize=None)
+def get_qcolor(hex_or_name: str) -> "QColor":
+    """Get a parsed QColor for a color string; treat the result as read-only."""
+    from PyQt6.QtGui import QColor
+    return QColor(hex_or_name)
+
+
+# Main theme stylesheet
+THEME = _build_theme()
+
+
+def apply_theme(app: "QApplication") -> None:
+    """Apply THEME once, application-wide.
+
+    Windows and dialogs inherit it; they should not set THEME themselves.
+    """
+    app.setStyleSheet(THEME)
@@ -1,5 +1,28 @@
-"""Utility modules for PyPDF Editor."""
+"""Utility modules for PyPDF Editor.
+
+Qt-dependent submodules are imported on first attribute access so that
+importing the logger (e.g. in OCR worker processes) does not pull in Qt.
+"""
 
 from .logger import setup_logging, get_logger
-from .settings import Settings
-from .file_io import get_open_path, get_save_path
+
+_LAZY_ATTRS = {
+    "Settings": ".settings",
+    "get_open_path": ".file_io",
+    "get_save_path": ".file_io",
+}
+
+__all__ = [
+    "setup_logging",
+    "get_logger",
+    "Settings",
+    "get_open_path",
+    "get_save_path",
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        from importlib import import_module
+        return getattr(import_module(_LAZY_ATTRS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,13 @@
 """File I/O operations for PDFs."""
 
 from pathlib import Path
-from datetime import datetime
+import time
 from PyQt6.QtWidgets import QFileDialog
 
 
 def generate_filename(prefix: str = "document", extension: str = "pdf") -> str:
     """Generate a timestamped filename."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     return f"{prefix}_{timestamp}.{extension}"
 
 
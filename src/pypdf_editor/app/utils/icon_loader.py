@@ -1,21 +1,34 @@
 """Icon loading utilities for PyPDF Editor."""
 
+from functools import lru_cache
+
 from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor
 from PyQt6.QtCore import Qt, QSize
 from PyQt6.QtSvg import QSvgRenderer
 from pathlib import Path
 
+from ..styles import get_qcolor
+
 
 class IconLoader:
     """Utility class for loading and caching icons."""
 
-    _cache: dict[str, QIcon] = {}
     _icon_dir: Path | None = None
+    _files: dict[str, Path] = {}  # icon name -> file, scanned once
 
     @classmethod
     def set_icon_directory(cls, path: Path):
         """Set the directory to load icons from."""
         cls._icon_dir = path
+        files: dict[str, Path] = {}
+        try:
+            # Sorted so ".svg" overrides ".png" when both exist
+            for p in sorted(path.iterdir()):
+                if p.suffix in (".png", ".svg"):
+                    files[p.stem] = p
+        except OSError:
+            pass
+        cls._files = files
 
     @classmethod
     def get_icon(
@@ -25,25 +38,25 @@ class IconLoader:
         color: QColor | str | None = None
     ) -> QIcon:
         """Get an icon by name, optionally with a custom color."""
-        cache_key = f"{name}_{size}_{color}"
-        if cache_key in cls._cache:
-            return cls._cache[cache_key]
+        if isinstance(color, QColor):
+            color = color.rgba()  # one int instead of a 4-tuple
+        return cls._cached(name, size, color)
 
-        icon = cls._load_icon(name, size, color)
-        cls._cache[cache_key] = icon
-        return icon
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _cached(name: str, size: int, color_key: int | str | None) -> QIcon:
+        """Load an icon once per (name, size, color) key."""
+        color = QColor.fromRgba(color_key) if isinstance(color_key, int) else color_key
+        return IconLoader._load_icon(name, size, color)
 
     @classmethod
     def _load_icon(cls, name: str, size: int, color: QColor | str | None) -> QIcon:
         """Load an icon from file or create a placeholder."""
-        if cls._icon_dir:
-            svg_path = cls._icon_dir / f"{name}.svg"
-            png_path = cls._icon_dir / f"{name}.png"
-
-            if svg_path.exists():
-                return cls._load_svg(svg_path, size, color)
-            elif png_path.exists():
-                return QIcon(str(png_path))
+        path = cls._files.get(name)
+        if path is not None:
+            if path.suffix == ".svg":
+                return cls._load_svg(path, size, color)
+            return QIcon(str(path))
 
         # Return empty icon if not found
         return QIcon()
@@ -60,30 +73,17 @@ class IconLoader:
 
         painter = QPainter(pixmap)
         renderer.render(painter)
-        painter.end()
-
         if color:
             if isinstance(color, str):
-                color = QColor(color)
-            pixmap = cls._tint_pixmap(pixmap, color)
-
-        return QIcon(pixmap)
-
-    @classmethod
-    def _tint_pixmap(cls, pixmap: QPixmap, color: QColor) -> QPixmap:
-        """Apply a color tint to a pixmap."""
-        tinted = QPixmap(pixmap.size())
-        tinted.fill(Qt.GlobalColor.transparent)
-
-        painter = QPainter(tinted)
-        painter.drawPixmap(0, 0, pixmap)
-        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
-        painter.fillRect(tinted.rect(), color)
+                color = get_qcolor(color)
+            # Tint in the same pass: keep the rendered alpha, replace the color
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+            painter.fillRect(pixmap.rect(), color)
         painter.end()
 
-        return tinted
+        return QIcon(pixmap)
 
     @classmethod
     def clear_cache(cls):
         """Clear the icon cache."""
-        cls._cache.clear()
+        cls._cached.cache_clear()
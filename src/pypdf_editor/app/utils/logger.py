@@ -3,16 +3,26 @@
 import logging
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from datetime import datetime
 
+# Records buffered before the log file is opened and written
+LOG_BUFFER_CAPACITY = 100
+
+
+class _LazyRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that creates its directory on first open."""
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
 
 def setup_logging(log_level=logging.DEBUG):
     """Set up application-wide logging with file and console handlers."""
 
-    # Create logs directory
+    # Logs directory; created when the file is first opened
     log_dir = Path.home() / ".pypdf_editor" / "logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
 
     # Log file path
     log_file = log_dir / "pypdf_editor.log"
@@ -34,16 +44,23 @@ def setup_logging(log_level=logging.DEBUG):
         datefmt='%H:%M:%S'
     )
 
-    # Rotating file handler (5 MB max, keep 5 backups)
-    file_handler = RotatingFileHandler(
+    # Rotating file handler (5 MB max, keep 5 backups). Records are
+    # buffered, so the file is only opened once a warning arrives, the
+    # buffer fills, or logging shuts down
+    file_handler = _LazyRotatingFileHandler(
         log_file,
         maxBytes=5 * 1024 * 1024,  # 5 MB
         backupCount=5,
-        encoding='utf-8'
+        encoding='utf-8',
+        delay=True
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(file_format)
-    logger.addHandler(file_handler)
+    logger.addHandler(MemoryHandler(
+        LOG_BUFFER_CAPACITY,
+        flushLevel=logging.WARNING,
+        target=file_handler
+    ))
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -1,13 +1,49 @@
 """Application settings management for PyPDF Editor."""
 
 import json
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import cached_property
 from pathlib import Path
-from PyQt6.QtCore import QStandardPaths
+from typing import Optional
+from PyQt6.QtCore import QCoreApplication, QStandardPaths, QThreadPool, QTimer
+
+# orjson is optional; it parses and serializes settings in C
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _read_json(path: Path):
+    """Read a JSON file, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data):
+    """Write an indented JSON file, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
 
 
 class Settings:
     """Manages application settings persistence."""
 
+    SAVE_DELAY_MS = 500  # batch rapid set() calls into one write
+
+    # Instances with unsaved changes, flushed on quit
+    _dirty_instances: "weakref.WeakSet[Settings]" = weakref.WeakSet()
+
     DEFAULT_SETTINGS = {
         "viewer": {
             "zoom_mode": "fit_width",
@@ -42,51 +78,75 @@ class Settings:
     }
 
     def __init__(self):
-        self._settings = self._deep_copy(self.DEFAULT_SETTINGS)
-        self._config_path = self._get_config_path()
+        # JSON round-trip is a C-level deep copy of the defaults
+        self._settings = json.loads(_DEFAULT_SERIALIZED)
+        self._dirty = False
+        self._save_scheduled = False
         self.load()
 
-    def _deep_copy(self, obj):
-        """Deep copy a nested dict/list structure."""
-        if isinstance(obj, dict):
-            return {k: self._deep_copy(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._deep_copy(i) for i in obj]
-        return obj
-
-    def _get_config_path(self) -> Path:
-        """Get the configuration file path."""
+    @cached_property
+    def _config_path(self) -> Path:
+        """Get the configuration file path (created on first save)."""
         config_dir = Path(QStandardPaths.writableLocation(
             QStandardPaths.StandardLocation.AppDataLocation
         )) / "PyPDFEditor"
-        config_dir.mkdir(parents=True, exist_ok=True)
         return config_dir / "settings.json"
 
     def load(self):
         """Load settings from disk."""
         if self._config_path.exists():
             try:
-                with open(self._config_path, 'r') as f:
-                    saved = json.load(f)
-                    self._deep_update(self._settings, saved)
+                saved = _read_json(self._config_path)
+                self._deep_update(self._settings, saved)
             except (json.JSONDecodeError, IOError):
                 pass  # Use defaults on error
+        # Most recent first; mirrored to the "recent_files" list on change
+        self._recent = OrderedDict.fromkeys(self.get("general", "recent_files", []))
 
     def save(self):
         """Save settings to disk."""
         try:
-            with open(self._config_path, 'w') as f:
-                json.dump(self._settings, f, indent=2)
-        except IOError:
+            self._config_path.parent.mkdir(parents=True, exist_ok=True)
+            _write_json(self._config_path, self._settings)
+        except (TypeError, IOError):
             pass
 
+    def flush(self):
+        """Write pending changes to disk, if any."""
+        self._save_scheduled = False
+        if self._dirty:
+            self._dirty = False
+            Settings._dirty_instances.discard(self)
+            self.save()
+
+    @classmethod
+    def flush_all(cls):
+        """Write pending changes of every Settings instance."""
+        for settings in list(cls._dirty_instances):
+            settings.flush()
+
+    def _schedule_save(self):
+        """Mark settings dirty and save once after a short delay."""
+        self._dirty = True
+        Settings._dirty_instances.add(self)
+        if QCoreApplication.instance() is None:
+            # No event loop to run the timer
+            self.flush()
+        elif not self._save_scheduled:
+            self._save_scheduled = True
+            QTimer.singleShot(self.SAVE_DELAY_MS, self.flush)
+
     def _deep_update(self, base: dict, update: dict):
-        """Recursively update nested dictionaries."""
-        for key, value in update.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._deep_update(base[key], value)
-            else:
-                base[key] = value
+        """Update nested dictionaries in place (iterative, no recursion)."""
+        stack = [(base, update)]
+        while stack:
+            base, update = stack.pop()
+            for key, value in update.items():
+                current = base.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    base[key] = value
 
     def get(self, category: str, key: str, default=None):
         """Get a setting value."""
@@ -97,7 +157,9 @@ class Settings:
         if category not in self._settings:
             self._settings[category] = {}
         self._settings[category][key] = value
-        self.save()
+        if category == "general" and key == "recent_files":
+            self._recent = OrderedDict.fromkeys(value)
+        self._schedule_save()
 
     def get_category(self, category: str) -> dict:
         """Get all settings in a category."""
@@ -114,17 +176,47 @@ class Settings:
 
     def add_recent_file(self, path: str):
         """Add a file to the recent files list."""
-        recent = self.get("general", "recent_files", [])
-        # Remove if already exists
-        if path in recent:
-            recent.remove(path)
-        # Add to front
-        recent.insert(0, path)
+        recent = self._recent
+        # Move (or add) to front
+        recent[path] = None
+        recent.move_to_end(path, last=False)
         # Trim to max size
         max_files = self.get("general", "max_recent_files", 10)
-        recent = recent[:max_files]
-        self.set("general", "recent_files", recent)
+        while len(recent) > max_files:
+            recent.popitem(last=True)
+        # Keep get()/get_category() in step; the list is at most max_files long
+        self._settings.setdefault("general", {})["recent_files"] = list(recent)
+        self._schedule_save()
 
     def get_recent_files(self) -> list:
         """Get the list of recent files."""
-        return self.get("general", "recent_files", [])
+        return list(self._recent)
+
+
+_DEFAULT_SERIALIZED = json.dumps(Settings.DEFAULT_SETTINGS)
+
+_preloaded: Optional[Future] = None
+
+
+def preload_settings():
+    """Start loading Settings on a pool thread."""
+    global _preloaded
+    future: Future = Future()
+
+    def run():
+        try:
+            future.set_result(Settings())
+        except Exception as e:
+            future.set_exception(e)
+
+    _preloaded = future
+    QThreadPool.globalInstance().start(run)
+
+
+def take_preloaded_settings() -> Settings:
+    """Get the preloaded Settings, or load them now if none are pending."""
+    global _preloaded
+    future, _preloaded = _preloaded, None
+    if future is None:
+        return Settings()
+    return future.result()
@@ -1,16 +1,15 @@
 #!/usr/bin/env python3
 """PyPDF Editor - Professional PDF editing tool."""
 
+import multiprocessing
 import sys
 import traceback
 
-# Set up logging FIRST before any other imports
 from .app.utils.logger import setup_logging, get_logger
-logger = setup_logging()
-log = get_logger("main")
 
-from PyQt6.QtWidgets import QApplication, QMessageBox
-from PyQt6.QtCore import Qt
+# Logging and Qt are set up in main(), not at import: spawned OCR worker
+# processes re-import this module and need neither
+log = get_logger("main")
 
 
 def exception_hook(exctype, value, tb):
@@ -19,6 +18,7 @@ def exception_hook(exctype, value, tb):
     log.critical(f"Unhandled exception: {error_msg}")
 
     try:
+        from PyQt6.QtWidgets import QMessageBox
         QMessageBox.critical(
             None,
             "PyPDF Editor Error",
@@ -30,9 +30,26 @@ def exception_hook(exctype, value, tb):
     sys.exit(1)
 
 
+def _shutdown_ocr_pool():
+    """Stop the OCR process pool if OCR was used this session."""
+    # Look the module up instead of importing it, so quitting never pulls
+    # in Tesseract just to find there is no pool
+    ocr_engine = sys.modules.get(f"{__package__}.app.ocr.ocr_engine")
+    if ocr_engine is not None:
+        ocr_engine.OCREngine.shutdown_pool()
+
+
 def main():
+    # Required for the OCR process pool in frozen Windows builds
+    multiprocessing.freeze_support()
+
+    # Set up logging FIRST before any other imports
+    setup_logging()
     log.info("Starting PyPDF Editor application...")
 
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import Qt
+
     # Install exception hook
     sys.excepthook = exception_hook
 
@@ -48,6 +65,18 @@ def main():
         app.setApplicationName("PyPDF Editor")
         app.setOrganizationName("PyPDFEditor")
 
+        # One global stylesheet, parsed before any widget is built
+        from .app.styles import apply_theme
+        apply_theme(app)
+
+        # Read settings off the UI thread while MainWindow is imported;
+        # flush ones still waiting on their save delay at quit
+        from .app.utils.settings import Settings, preload_settings
+        preload_settings()
+        app.aboutToQuit.connect(Settings.flush_all)
+        # Drop queued OCR jobs instead of finishing them before exit
+        app.aboutToQuit.connect(_shutdown_ocr_pool)
+
         log.debug("Qt application created successfully")
 
         log.debug("Importing MainWindow...")
@@ -4,5 +4,9 @@ from .screen import capture_full_screen
 from .region import RegionSelector
 from .window import capture_window
 from .scrolling import ScrollingCapture
+from .task import CaptureTask
 
-__all__ = ['capture_full_screen', 'RegionSelector', 'capture_window', 'ScrollingCapture']
+__all__ = [
+    'capture_full_screen', 'RegionSelector', 'capture_window',
+    'ScrollingCapture', 'CaptureTask'
+]
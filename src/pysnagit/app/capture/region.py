@@ -144,6 +144,9 @@ class RegionSelector(QWidget):
                     selection.size()
                 )
                 self.region_selected.emit(global_rect)
+            else:
+                # A click or tiny drag is not a selection; treat it as a cancel
+                self.selection_cancelled.emit()
 
             self.hide()
             self._reset()
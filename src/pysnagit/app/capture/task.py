@@ -0,0 +1,42 @@
+"""Background capture task."""
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from .window import release_sct
+from ..utils.clipboard import image_to_rgba_bytes
+
+
+class CaptureSignals(QObject):
+    """Signals for CaptureTask."""
+
+    captured = pyqtSignal(object, object)  # PIL image, (rgba bytes, width, height)
+    failed = pyqtSignal(str)
+
+
+class CaptureTask(QRunnable):
+    """Runs a capture function on the thread pool.
+
+    The clipboard payload is packed here too, so the GUI thread only has to
+    wrap it in a QImage.
+    """
+
+    def __init__(self, capture_fn, *args):
+        super().__init__()
+        self._capture_fn = capture_fn
+        self._args = args
+        self.signals = CaptureSignals()
+
+    def run(self):
+        try:
+            image = self._capture_fn(*self._args)
+            if image is None:
+                self.signals.failed.emit("")
+                return
+            payload = image_to_rgba_bytes(image)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        finally:
+            # The pool thread may expire before the next capture
+            release_sct()
+        self.signals.captured.emit(image, payload)
@@ -1,6 +1,8 @@
 """Window capture functionality."""
 
+import atexit
 import ctypes
+import threading
 from ctypes import wintypes
 from PIL import Image
 import mss
@@ -9,6 +11,50 @@ import mss
 user32 = ctypes.windll.user32
 dwmapi = ctypes.windll.dwmapi
 
+WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+
+
+# One mss instance per thread; creating one sets up a new device context
+_tls = threading.local()
+_sct_instances: list = []
+
+
+def _sct() -> "mss.base.MSSBase":
+    """Get this thread's cached mss instance."""
+    sct = getattr(_tls, "sct", None)
+    if sct is None:
+        sct = _tls.sct = mss.mss()
+        _sct_instances.append(sct)
+    return sct
+
+
+def release_sct():
+    """Close this thread's cached mss instance, if any.
+
+    Pool threads expire when idle, so tasks running on them release their
+    instance when done instead of leaving it for interpreter exit.
+    """
+    sct = getattr(_tls, "sct", None)
+    if sct is None:
+        return
+    _tls.sct = None
+    try:
+        _sct_instances.remove(sct)
+        sct.close()
+    except Exception:
+        pass
+
+
+@atexit.register
+def _close_sct():
+    """Release cached mss instances at interpreter exit."""
+    for sct in _sct_instances:
+        try:
+            sct.close()
+        except Exception:
+            pass
+    _sct_instances.clear()
+
 
 class RECT(ctypes.Structure):
     _fields_ = [
@@ -19,6 +65,32 @@ class RECT(ctypes.Structure):
     ]
 
 
+# Declare prototypes once so ctypes skips per-call argument guessing
+# (and HWNDs are not truncated to 32-bit ints)
+user32.EnumWindows.argtypes = [WNDENUMPROC, wintypes.LPARAM]
+user32.EnumWindows.restype = wintypes.BOOL
+user32.IsWindowVisible.argtypes = [wintypes.HWND]
+user32.IsWindowVisible.restype = wintypes.BOOL
+user32.IsWindow.argtypes = [wintypes.HWND]
+user32.IsWindow.restype = wintypes.BOOL
+user32.GetWindowTextLengthW.argtypes = [wintypes.HWND]
+user32.GetWindowTextLengthW.restype = ctypes.c_int
+user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+user32.GetWindowTextW.restype = ctypes.c_int
+user32.GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(RECT)]
+user32.GetWindowRect.restype = wintypes.BOOL
+user32.GetCursorPos.argtypes = [ctypes.POINTER(wintypes.POINT)]
+user32.GetCursorPos.restype = wintypes.BOOL
+user32.WindowFromPoint.argtypes = [wintypes.POINT]
+user32.WindowFromPoint.restype = wintypes.HWND
+user32.SetForegroundWindow.argtypes = [wintypes.HWND]
+user32.SetForegroundWindow.restype = wintypes.BOOL
+dwmapi.DwmGetWindowAttribute.argtypes = [
+    wintypes.HWND, wintypes.DWORD, wintypes.LPVOID, wintypes.DWORD
+]
+dwmapi.DwmGetWindowAttribute.restype = ctypes.c_long
+
+
 def get_window_at_cursor() -> int:
     """Get the window handle at the current cursor position."""
     point = wintypes.POINT()
@@ -65,31 +137,55 @@ def get_window_title(hwnd: int) -> str:
 
 def get_all_windows() -> list[dict]:
     """Get a list of all visible windows."""
-    windows = []
+    hwnds = []
+    is_visible = user32.IsWindowVisible
 
     def enum_callback(hwnd, _):
-        if user32.IsWindowVisible(hwnd):
-            title = get_window_title(hwnd)
-            if title:  # Only include windows with titles
-                left, top, width, height = get_window_rect(hwnd)
-                if width > 0 and height > 0:
-                    windows.append({
-                        "hwnd": hwnd,
-                        "title": title,
-                        "left": left,
-                        "top": top,
-                        "width": width,
-                        "height": height
-                    })
+        # Only collect handles here; metadata is resolved in one pass below
+        if is_visible(hwnd):
+            hwnds.append(hwnd)
         return True
 
-    WNDENUMPROC = ctypes.WINFUNCTYPE(
-        ctypes.c_bool,
-        ctypes.c_int,
-        ctypes.c_int
-    )
     user32.EnumWindows(WNDENUMPROC(enum_callback), 0)
 
+    # Bind API functions and reuse one rect/buffer for every window
+    get_text_length = user32.GetWindowTextLengthW
+    get_text = user32.GetWindowTextW
+    get_frame_bounds = dwmapi.DwmGetWindowAttribute
+    get_rect = user32.GetWindowRect
+    DWMWA_EXTENDED_FRAME_BOUNDS = 9
+    rect = RECT()
+    rect_ref = ctypes.byref(rect)
+    rect_size = ctypes.sizeof(rect)
+    title_buffer = ctypes.create_unicode_buffer(512)
+
+    windows = []
+    for hwnd in hwnds:
+        length = get_text_length(hwnd)
+        if not length:  # Only include windows with titles
+            continue
+        buffer = title_buffer
+        if length >= len(buffer):
+            buffer = ctypes.create_unicode_buffer(length + 1)
+        get_text(hwnd, buffer, len(buffer))
+        title = buffer.value
+        if not title:
+            continue
+
+        if get_frame_bounds(hwnd, DWMWA_EXTENDED_FRAME_BOUNDS, rect_ref, rect_size) != 0:
+            get_rect(hwnd, rect_ref)
+        width = rect.right - rect.left
+        height = rect.bottom - rect.top
+        if width > 0 and height > 0:
+            windows.append({
+                "hwnd": hwnd,
+                "title": title,
+                "left": rect.left,
+                "top": rect.top,
+                "width": width,
+                "height": height
+            })
+
     return windows
 
 
@@ -113,19 +209,23 @@ def capture_window(hwnd: int = None) -> Image.Image | None:
     if width <= 0 or height <= 0:
         return None
 
-    with mss.mss() as sct:
-        region = {
-            "left": left,
-            "top": top,
-            "width": width,
-            "height": height
-        }
-        screenshot = sct.grab(region)
-        return Image.frombytes(
-            'RGB',
-            (screenshot.width, screenshot.height),
-            screenshot.rgb
-        )
+    region = {
+        "left": left,
+        "top": top,
+        "width": width,
+        "height": height
+    }
+    screenshot = _sct().grab(region)
+    # Decode the raw BGRA buffer in C instead of building .rgb first
+    return Image.frombuffer(
+        'RGB',
+        (screenshot.width, screenshot.height),
+        screenshot.raw,
+        'raw',
+        'BGRX',
+        0,
+        1
+    )
 
 
 def bring_window_to_front(hwnd: int):
@@ -1,5 +1,7 @@
 """Image editor canvas with zoom, pan, and annotation support."""
 
+from contextlib import contextmanager
+
 from PyQt6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsPixmapItem
 from PyQt6.QtCore import Qt, pyqtSignal, QPointF, QRectF
 from PyQt6.QtGui import (
@@ -35,6 +37,7 @@ class EditorCanvas(QGraphicsView):
 
         self._current_tool = None
         self._annotations = []
+        self._batch_depth = 0
 
         self._setup_view()
 
@@ -59,18 +62,19 @@ class EditorCanvas(QGraphicsView):
             if image.mode != 'RGBA':
                 image = image.convert('RGBA')
 
-            # Keep data reference alive to prevent garbage collection
-            self._image_data = image.tobytes('raw', 'RGBA')
+            # Pillow has no public zero-copy buffer, so tobytes() is one
+            # copy; QPixmap.fromImage makes its own, so the bytes only need
+            # to outlive this call and no QImage.copy() is needed
+            pixels = image.tobytes('raw', 'RGBA')
             qimage = QImage(
-                self._image_data,
+                pixels,
                 image.width,
                 image.height,
                 image.width * 4,  # bytes per line
                 QImage.Format.Format_RGBA8888
             )
-            # Make a copy to avoid data corruption
-            qimage = qimage.copy()
             pixmap = QPixmap.fromImage(qimage)
+            del qimage, pixels
 
             # Clear and add to scene
             self._scene.clear()
@@ -147,6 +151,23 @@ class EditorCanvas(QGraphicsView):
         else:
             self.setCursor(Qt.CursorShape.ArrowCursor)
 
+    @contextmanager
+    def batch_updates(self):
+        """Suspend repaints while many annotations change; repaint once after.
+
+        Reentrant: only the outermost block re-enables updates.
+        """
+        if self._batch_depth == 0:
+            self.setUpdatesEnabled(False)
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.setUpdatesEnabled(True)
+                self.viewport().update()
+
     def add_annotation(self, item):
         """Add an annotation item to the scene."""
         self._annotations.append(item)
@@ -2,10 +2,9 @@
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QStatusBar, QLabel, QFileDialog, QMessageBox, QToolBar, QToolButton,
-    QGraphicsDropShadowEffect
+    QStatusBar, QLabel, QFileDialog, QMessageBox, QToolBar, QToolButton
 )
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QRect, QThreadPool, pyqtSlot
 from PyQt6.QtGui import QAction, QKeySequence, QColor
 from PIL import Image
 
@@ -22,14 +21,50 @@ from .tools.highlight import HighlightTool
 from .tools.blur import BlurTool, PixelateTool
 from .tools.crop import CropTool
 from .tools.stamp import StampTool
-from ..utils.clipboard import copy_to_clipboard
+from ..utils.clipboard import copy_to_clipboard, copy_rgba_to_clipboard
 from ..utils.file_io import save_image, get_save_path, generate_filename
 from ..utils.icon_loader import IconLoader
-from ..styles import DARK_THEME, COLORS, MACOS_BIGSUR_THEME, MACOS_COLORS, MACOS_RADIUS
+from ..styles import DARK_THEME, COLORS
 from ..animations import AnimationManager
 from ..capture.screen import capture_full_screen
 from ..capture.region import RegionSelector, capture_selected_region
 from ..capture.window import capture_window
+from ..capture.task import CaptureTask
+
+
+# Capture toolbar icon colors
+_ICON_COLOR_DARK = QColor(60, 60, 67)
+_ICON_COLOR_PRIMARY = QColor(0, 122, 255)
+_ICON_COLOR_WHITE = QColor(255, 255, 255)
+
+# Menu bar layout: (menu title, entries). Each entry is None for a
+# separator or (text, shortcut, slot attribute path, attribute to store as)
+_MENU_SPEC = (
+    ("&File", (
+        ("New &Full Screen Capture", "Print", "_new_full_capture", None),
+        ("New &Region Capture", "Ctrl+Shift+R", "_new_region_capture", None),
+        ("New &Window Capture", "Alt+Print", "_new_window_capture", None),
+        None,
+        ("&Save", QKeySequence.StandardKey.Save, "_save", None),
+        ("Save &As...", QKeySequence.StandardKey.SaveAs, "_save_as", None),
+        None,
+        ("&Copy to Clipboard", QKeySequence.StandardKey.Copy, "_copy_to_clipboard", None),
+        None,
+        ("&Close", QKeySequence.StandardKey.Close, "close", None),
+    )),
+    ("&Edit", (
+        ("&Undo", QKeySequence.StandardKey.Undo, "_undo", "_undo_action"),
+        ("&Redo", QKeySequence.StandardKey.Redo, "_redo", "_redo_action"),
+        None,
+        ("&Clear All Annotations", None, "_clear_annotations", None),
+    )),
+    ("&View", (
+        ("Zoom &In", QKeySequence.StandardKey.ZoomIn, "_canvas.zoom_in", None),
+        ("Zoom &Out", QKeySequence.StandardKey.ZoomOut, "_canvas.zoom_out", None),
+        ("&Fit in View", "Ctrl+0", "_canvas.fit_in_view", None),
+        ("&Actual Size", "Ctrl+1", "_actual_size", None),
+    )),
+)
 
 
 class EditorWindow(QMainWindow):
@@ -39,14 +74,14 @@ class EditorWindow(QMainWindow):
         super().__init__(parent)
         self._settings = settings
         self._layer_manager = LayerManager(self)
-        self._tools = {}
+        self._tools = {}  # tool id -> instance, built on first selection
+        self._tool_factories = {}
         self._current_tool = None
         self._region_selector = None
+        self._capture_task = None
+        self._capture_pending = False  # one capture at a time
         self._has_shown_animation = False
 
-        # Apply macOS Big Sur+ theme
-        self.setStyleSheet(MACOS_BIGSUR_THEME)
-
         self._setup_ui()
         self._setup_tools()
         self._setup_menu()
@@ -71,119 +106,34 @@ class EditorWindow(QMainWindow):
         # Capture toolbar (top) - macOS style with polish
         capture_toolbar = QToolBar("Capture")
         capture_toolbar.setMovable(False)
-        capture_toolbar.setStyleSheet(f"""
-            QToolBar {{
-                background-color: {MACOS_COLORS['bg_white']};
-                border-bottom: 1px solid {MACOS_COLORS['border_light']};
-                padding: 8px 16px;
-                spacing: 12px;
-            }}
-            QToolButton {{
-                background-color: transparent;
-                border: 1px solid transparent;
-                border-radius: {MACOS_RADIUS['medium']};
-                padding: 6px 14px;
-                font-size: 13px;
-                font-weight: 500;
-                color: {MACOS_COLORS['text_primary']};
-            }}
-            QToolButton:hover {{
-                background-color: {MACOS_COLORS['bg_hover']};
-                border-color: {MACOS_COLORS['border_light']};
-            }}
-            QToolButton:pressed {{
-                background-color: {MACOS_COLORS['border_light']};
-            }}
-        """)
-
-        # Full Screen button
-        btn_new_full = QToolButton()
-        btn_new_full.setIcon(IconLoader.get_icon("fullscreen", size=18, color=QColor(60, 60, 67)))
-        btn_new_full.setIconSize(QSize(18, 18))
-        btn_new_full.setText(" Full Screen")
-        btn_new_full.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
-        btn_new_full.setToolTip("Capture full screen (Print)")
-        btn_new_full.clicked.connect(self._new_full_capture)
-        btn_new_full.setCursor(Qt.CursorShape.PointingHandCursor)
-        capture_toolbar.addWidget(btn_new_full)
-
-        # Region button
-        btn_new_region = QToolButton()
-        btn_new_region.setIcon(IconLoader.get_icon("region", size=18, color=QColor(60, 60, 67)))
-        btn_new_region.setIconSize(QSize(18, 18))
-        btn_new_region.setText(" Region")
-        btn_new_region.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
-        btn_new_region.setToolTip("Capture region (Ctrl+Shift+R)")
-        btn_new_region.clicked.connect(self._new_region_capture)
-        btn_new_region.setCursor(Qt.CursorShape.PointingHandCursor)
-        capture_toolbar.addWidget(btn_new_region)
-
-        # Window button
-        btn_new_window = QToolButton()
-        btn_new_window.setIcon(IconLoader.get_icon("window", size=18, color=QColor(60, 60, 67)))
-        btn_new_window.setIconSize(QSize(18, 18))
-        btn_new_window.setText(" Window")
-        btn_new_window.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
-        btn_new_window.setToolTip("Capture window (Alt+Print)")
-        btn_new_window.clicked.connect(self._new_window_capture)
-        btn_new_window.setCursor(Qt.CursorShape.PointingHandCursor)
-        capture_toolbar.addWidget(btn_new_window)
+        capture_toolbar.setObjectName("captureToolbar")
+
+        self._capture_buttons = tuple(
+            self._make_toolbutton(icon, label, tooltip, slot)
+            for icon, label, tooltip, slot in (
+                ("fullscreen", "Full Screen", "Capture full screen (Print)", self._new_full_capture),
+                ("region", "Region", "Capture region (Ctrl+Shift+R)", self._new_region_capture),
+                ("window", "Window", "Capture window (Alt+Print)", self._new_window_capture),
+            )
+        )
+        for btn in self._capture_buttons:
+            capture_toolbar.addWidget(btn)
 
         capture_toolbar.addSeparator()
 
-        # Copy button - primary style
-        btn_copy = QToolButton()
-        btn_copy.setIcon(IconLoader.get_icon("copy", size=18, color=QColor(0, 122, 255)))
-        btn_copy.setIconSize(QSize(18, 18))
-        btn_copy.setText(" Copy")
-        btn_copy.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
-        btn_copy.setToolTip("Copy to clipboard (Ctrl+C)")
-        btn_copy.clicked.connect(self._copy_to_clipboard)
-        btn_copy.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn_copy.setStyleSheet(f"""
-            QToolButton {{
-                background-color: {MACOS_COLORS['primary_ultra_light']};
-                border: 1px solid {MACOS_COLORS['primary']};
-                border-radius: {MACOS_RADIUS['medium']};
-                padding: 6px 14px;
-                font-weight: 600;
-                color: {MACOS_COLORS['primary']};
-            }}
-            QToolButton:hover {{
-                background-color: {MACOS_COLORS['primary_light']};
-            }}
-            QToolButton:pressed {{
-                background-color: {MACOS_COLORS['primary']};
-                color: white;
-            }}
-        """)
+        # Copy / Save buttons - primary style
+        btn_copy = self._make_toolbutton(
+            "copy", "Copy", "Copy to clipboard (Ctrl+C)",
+            self._copy_to_clipboard, _ICON_COLOR_PRIMARY
+        )
+        btn_copy.setObjectName("btnCopy")
         capture_toolbar.addWidget(btn_copy)
 
-        # Save button - primary style
-        btn_save = QToolButton()
-        btn_save.setIcon(IconLoader.get_icon("save", size=18, color=QColor(255, 255, 255)))
-        btn_save.setIconSize(QSize(18, 18))
-        btn_save.setText(" Save")
-        btn_save.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
-        btn_save.setToolTip("Save image (Ctrl+S)")
-        btn_save.clicked.connect(self._save_as)
-        btn_save.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn_save.setStyleSheet(f"""
-            QToolButton {{
-                background-color: {MACOS_COLORS['primary']};
-                border: none;
-                border-radius: {MACOS_RADIUS['medium']};
-                padding: 6px 14px;
-                font-weight: 600;
-                color: white;
-            }}
-            QToolButton:hover {{
-                background-color: {MACOS_COLORS['primary_hover']};
-            }}
-            QToolButton:pressed {{
-                background-color: {MACOS_COLORS['primary_dark']};
-            }}
-        """)
+        btn_save = self._make_toolbutton(
+            "save", "Save", "Save image (Ctrl+S)",
+            self._save_as, _ICON_COLOR_WHITE
+        )
+        btn_save.setObjectName("btnSave")
         capture_toolbar.addWidget(btn_save)
 
         self.addToolBar(capture_toolbar)
@@ -207,9 +157,7 @@ class EditorWindow(QMainWindow):
         self._layer_panel.redo_requested.connect(self._redo)
         content_layout.addWidget(self._layer_panel)
 
-        content_widget = QWidget()
-        content_widget.setLayout(content_layout)
-        main_layout.addWidget(content_widget)
+        main_layout.addLayout(content_layout)
 
         # Status bar
         self._status_bar = QStatusBar()
@@ -217,117 +165,67 @@ class EditorWindow(QMainWindow):
 
         self._zoom_label = QLabel("100%")
         self._status_bar.addPermanentWidget(self._zoom_label)
+        self._last_zoom_pct = 100
 
         self._size_label = QLabel("")
         self._status_bar.addPermanentWidget(self._size_label)
+        self._last_size = None
 
     def _setup_tools(self):
-        """Initialize annotation tools."""
+        """Register annotation tools; each is constructed on first use."""
         self._tools = {
             "select": None,  # Selection tool (no drawing)
-            "arrow": ArrowTool(),
-            "line": LineTool(),
-            "rect": RectTool(),
-            "ellipse": EllipseTool(),
-            "text": TextTool(),
-            "highlight": HighlightTool(),
-            "blur": BlurTool(),
-            "crop": CropTool(),
-            "stamp": StampTool(),
+        }
+        self._tool_factories = {
+            "arrow": ArrowTool,
+            "line": LineTool,
+            "rect": RectTool,
+            "ellipse": EllipseTool,
+            "text": TextTool,
+            "highlight": HighlightTool,
+            "blur": BlurTool,
+            "crop": CropTool,
+            "stamp": StampTool,
         }
 
+    def _make_toolbutton(self, icon_name: str, label: str, tooltip: str,
+                         slot, icon_color: QColor = _ICON_COLOR_DARK) -> QToolButton:
+        """Create a text-beside-icon toolbar button wired to slot."""
+        btn = QToolButton()
+        btn.setIcon(IconLoader.get_icon(icon_name, size=18, color=icon_color))
+        btn.setIconSize(QSize(18, 18))
+        btn.setText(f" {label}")
+        btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
+        btn.setToolTip(tooltip)
+        btn.clicked.connect(slot)
+        btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        return btn
+
     def _setup_menu(self):
-        """Set up the menu bar."""
+        """Set up the menu bar from _MENU_SPEC."""
         menubar = self.menuBar()
-
-        # File menu
-        file_menu = menubar.addMenu("&File")
-
-        # New capture options
-        new_full_action = QAction("New &Full Screen Capture", self)
-        new_full_action.setShortcut("Print")
-        new_full_action.triggered.connect(self._new_full_capture)
-        file_menu.addAction(new_full_action)
-
-        new_region_action = QAction("New &Region Capture", self)
-        new_region_action.setShortcut("Ctrl+Shift+R")
-        new_region_action.triggered.connect(self._new_region_capture)
-        file_menu.addAction(new_region_action)
-
-        new_window_action = QAction("New &Window Capture", self)
-        new_window_action.setShortcut("Alt+Print")
-        new_window_action.triggered.connect(self._new_window_capture)
-        file_menu.addAction(new_window_action)
-
-        file_menu.addSeparator()
-
-        save_action = QAction("&Save", self)
-        save_action.setShortcut(QKeySequence.StandardKey.Save)
-        save_action.triggered.connect(self._save)
-        file_menu.addAction(save_action)
-
-        save_as_action = QAction("Save &As...", self)
-        save_as_action.setShortcut(QKeySequence.StandardKey.SaveAs)
-        save_as_action.triggered.connect(self._save_as)
-        file_menu.addAction(save_as_action)
-
-        file_menu.addSeparator()
-
-        copy_action = QAction("&Copy to Clipboard", self)
-        copy_action.setShortcut(QKeySequence.StandardKey.Copy)
-        copy_action.triggered.connect(self._copy_to_clipboard)
-        file_menu.addAction(copy_action)
-
-        file_menu.addSeparator()
-
-        close_action = QAction("&Close", self)
-        close_action.setShortcut(QKeySequence.StandardKey.Close)
-        close_action.triggered.connect(self.close)
-        file_menu.addAction(close_action)
-
-        # Edit menu
-        edit_menu = menubar.addMenu("&Edit")
-
-        undo_action = QAction("&Undo", self)
-        undo_action.setShortcut(QKeySequence.StandardKey.Undo)
-        undo_action.triggered.connect(self._undo)
-        edit_menu.addAction(undo_action)
-        self._undo_action = undo_action
-
-        redo_action = QAction("&Redo", self)
-        redo_action.setShortcut(QKeySequence.StandardKey.Redo)
-        redo_action.triggered.connect(self._redo)
-        edit_menu.addAction(redo_action)
-        self._redo_action = redo_action
-
-        edit_menu.addSeparator()
-
-        clear_action = QAction("&Clear All Annotations", self)
-        clear_action.triggered.connect(self._clear_annotations)
-        edit_menu.addAction(clear_action)
-
-        # View menu
-        view_menu = menubar.addMenu("&View")
-
-        zoom_in_action = QAction("Zoom &In", self)
-        zoom_in_action.setShortcut(QKeySequence.StandardKey.ZoomIn)
-        zoom_in_action.triggered.connect(self._canvas.zoom_in)
-        view_menu.addAction(zoom_in_action)
-
-        zoom_out_action = QAction("Zoom &Out", self)
-        zoom_out_action.setShortcut(QKeySequence.StandardKey.ZoomOut)
-        zoom_out_action.triggered.connect(self._canvas.zoom_out)
-        view_menu.addAction(zoom_out_action)
-
-        fit_action = QAction("&Fit in View", self)
-        fit_action.setShortcut("Ctrl+0")
-        fit_action.triggered.connect(self._canvas.fit_in_view)
-        view_menu.addAction(fit_action)
-
-        actual_action = QAction("&Actual Size", self)
-        actual_action.setShortcut("Ctrl+1")
-        actual_action.triggered.connect(lambda: self._canvas.set_zoom(1.0))
-        view_menu.addAction(actual_action)
+        for title, entries in _MENU_SPEC:
+            menu = menubar.addMenu(title)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                    continue
+                text, shortcut, slot_path, attr = entry
+                action = QAction(text, self)
+                if shortcut is not None:
+                    action.setShortcut(shortcut)
+                # slot_path may reach into a child, e.g. "_canvas.zoom_in"
+                target = self
+                for name in slot_path.split("."):
+                    target = getattr(target, name)
+                action.triggered.connect(target)
+                menu.addAction(action)
+                if attr:
+                    setattr(self, attr, action)
+
+        # Matches LayerManager's initial state
+        self._undo_action.setEnabled(False)
+        self._redo_action.setEnabled(False)
 
     def _setup_connections(self):
         """Set up signal connections."""
@@ -341,12 +239,8 @@ class EditorWindow(QMainWindow):
         self._canvas.zoom_changed.connect(self._on_zoom_changed)
 
         # Layer manager signals
-        self._layer_manager.can_undo_changed.connect(
-            lambda can: self._undo_action.setEnabled(can)
-        )
-        self._layer_manager.can_redo_changed.connect(
-            lambda can: self._redo_action.setEnabled(can)
-        )
+        self._layer_manager.can_undo_changed.connect(self._undo_action.setEnabled)
+        self._layer_manager.can_redo_changed.connect(self._redo_action.setEnabled)
 
         # Update layer panel when undo/redo state changes
         self._layer_manager.can_undo_changed.connect(self._layer_panel.set_undo_enabled)
@@ -360,11 +254,15 @@ class EditorWindow(QMainWindow):
     def set_image(self, image: Image.Image):
         """Set the image to edit."""
         self._canvas.set_image(image)
-        self._size_label.setText(f"{image.width} x {image.height}")
+        if image.size != self._last_size:
+            self._last_size = image.size
+            self._size_label.setText(f"{image.width} x {image.height}")
 
     def _on_tool_selected(self, tool_id: str):
         """Handle tool selection."""
         tool = self._tools.get(tool_id)
+        if tool is None and tool_id in self._tool_factories:
+            tool = self._tools[tool_id] = self._tool_factories[tool_id]()
         self._current_tool = tool
 
         if tool:
@@ -393,7 +291,15 @@ class EditorWindow(QMainWindow):
 
     def _on_zoom_changed(self, factor: float):
         """Handle zoom level change."""
-        self._zoom_label.setText(f"{int(factor * 100)}%")
+        pct = int(factor * 100)
+        if pct == self._last_zoom_pct:
+            return
+        self._last_zoom_pct = pct
+        self._zoom_label.setText(f"{pct}%")
+
+    def _actual_size(self):
+        """Zoom to 100%."""
+        self._canvas.set_zoom(1.0)
 
     def _save(self):
         """Save the image."""
@@ -450,18 +356,36 @@ class EditorWindow(QMainWindow):
         self._layer_manager.clear_layers()
         self._status_bar.showMessage("Cleared all annotations")
 
+    def _begin_capture(self) -> bool:
+        """Claim the capture slot; False if a capture is already under way."""
+        if self._capture_pending:
+            return False
+        self._capture_pending = True
+        for btn in self._capture_buttons:
+            btn.setEnabled(False)
+        return True
+
+    def _end_capture(self):
+        """Release the capture slot."""
+        self._capture_pending = False
+        for btn in self._capture_buttons:
+            btn.setEnabled(True)
+
     def _new_full_capture(self):
         """Capture full screen and load into editor."""
+        if not self._begin_capture():
+            return
         self.hide()
         QTimer.singleShot(200, self._do_full_capture)
 
     def _do_full_capture(self):
         """Perform full screen capture."""
-        image = capture_full_screen()
-        self._load_new_capture(image)
+        self._start_capture(capture_full_screen)
 
     def _new_region_capture(self):
         """Capture region and load into editor."""
+        if not self._begin_capture():
+            return
         self.hide()
         QTimer.singleShot(100, self._show_region_selector)
 
@@ -474,30 +398,54 @@ class EditorWindow(QMainWindow):
 
     def _on_region_selected(self, rect):
         """Handle region selection."""
-        image = capture_selected_region(rect)
-        self._load_new_capture(image)
+        self._start_capture(capture_selected_region, QRect(rect))
 
     def _on_capture_cancelled(self):
         """Handle capture cancellation."""
+        self._end_capture()
         self.show()
         self._status_bar.showMessage("Capture cancelled")
 
     def _new_window_capture(self):
         """Capture window and load into editor."""
+        if not self._begin_capture():
+            return
         self.hide()
         QTimer.singleShot(500, self._do_window_capture)
 
     def _do_window_capture(self):
         """Perform window capture."""
-        image = capture_window()
-        if image:
-            self._load_new_capture(image)
-        else:
-            self.show()
-            self._status_bar.showMessage("Failed to capture window")
+        self._start_capture(capture_window)
+
+    def _start_capture(self, capture_fn, *args):
+        """Run a capture off the GUI thread; the result loads when ready."""
+        task = CaptureTask(capture_fn, *args)
+        task.signals.captured.connect(self._on_capture_ready)
+        task.signals.failed.connect(self._on_capture_failed)
+        self._capture_task = task
+        QThreadPool.globalInstance().start(task)
+
+    @pyqtSlot(object, object)
+    def _on_capture_ready(self, image: Image.Image, clipboard_data: tuple):
+        """Load a finished background capture."""
+        self._capture_task = None
+        self._end_capture()
+        self._load_new_capture(image, clipboard_data)
+
+    @pyqtSlot(str)
+    def _on_capture_failed(self, error: str):
+        """Handle a failed background capture."""
+        self._capture_task = None
+        self._end_capture()
+        self.show()
+        self._status_bar.showMessage("Capture failed")
 
-    def _load_new_capture(self, image: Image.Image):
-        """Load a new capture into the editor."""
+    def _load_new_capture(self, image: Image.Image, clipboard_data: tuple = None):
+        """Load a new capture into the editor.
+
+        ``clipboard_data`` is the (rgba bytes, width, height) payload packed
+        by CaptureTask; without it the image is packed here.
+        """
         # Clear existing annotations
         self._canvas.clear_annotations()
         self._layer_manager.clear_layers()
@@ -506,7 +454,10 @@ class EditorWindow(QMainWindow):
         self.set_image(image)
 
         # Copy to clipboard
-        copy_to_clipboard(image)
+        if clipboard_data:
+            copy_rgba_to_clipboard(*clipboard_data)
+        else:
+            copy_to_clipboard(image)
 
         # Show window
         self.show()
@@ -1,59 +1,76 @@
 """Layer management and undo/redo system."""
 
+from collections import deque
+from dataclasses import dataclass
+
 from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtWidgets import QGraphicsItem
-from copy import deepcopy
+
+
+@dataclass(slots=True, frozen=True)
+class AddAction:
+    """Undo record for an added layer."""
+    item: QGraphicsItem
+
+
+@dataclass(slots=True, frozen=True)
+class RemoveAction:
+    """Undo record for a removed layer and its former position."""
+    item: QGraphicsItem
+    index: int
+
+
+@dataclass(slots=True, frozen=True)
+class ClearAction:
+    """Undo record for a cleared layer list."""
+    items: list
+
+
+UndoAction = AddAction | RemoveAction | ClearAction
 
 
 class UndoStack:
     """Simple undo/redo stack for editor actions."""
 
     def __init__(self, max_size: int = 50):
-        self._stack = []
-        self._index = -1
-        self._max_size = max_size
+        # maxlen drops the oldest action on overflow
+        self._undo = deque(maxlen=max_size)
+        self._redo = deque(maxlen=max_size)
 
-    def push(self, action: dict):
+    def push(self, action: UndoAction):
         """Push a new action onto the stack."""
-        # Remove any actions after current index
-        self._stack = self._stack[:self._index + 1]
-
-        # Add new action
-        self._stack.append(action)
+        # A new action invalidates anything that could be redone
+        self._redo.clear()
+        self._undo.append(action)
 
-        # Trim if too large
-        if len(self._stack) > self._max_size:
-            self._stack.pop(0)
-        else:
-            self._index = len(self._stack) - 1
-
-    def undo(self) -> dict | None:
+    def undo(self) -> UndoAction | None:
         """Get the action to undo."""
-        if self._index >= 0:
-            action = self._stack[self._index]
-            self._index -= 1
+        if self._undo:
+            action = self._undo.pop()
+            self._redo.append(action)
             return action
         return None
 
-    def redo(self) -> dict | None:
+    def redo(self) -> UndoAction | None:
         """Get the action to redo."""
-        if self._index < len(self._stack) - 1:
-            self._index += 1
-            return self._stack[self._index]
+        if self._redo:
+            action = self._redo.pop()
+            self._undo.append(action)
+            return action
         return None
 
     def can_undo(self) -> bool:
         """Check if undo is available."""
-        return self._index >= 0
+        return bool(self._undo)
 
     def can_redo(self) -> bool:
         """Check if redo is available."""
-        return self._index < len(self._stack) - 1
+        return bool(self._redo)
 
     def clear(self):
         """Clear the stack."""
-        self._stack.clear()
-        self._index = -1
+        self._undo.clear()
+        self._redo.clear()
 
 
 class LayerManager(QObject):
@@ -66,33 +83,32 @@ class LayerManager(QObject):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._layers = []
+        self._layer_ids: set[int] = set()  # id() of each item, for O(1) membership
         self._undo_stack = UndoStack()
+        # Last emitted availability, so unchanged states are not re-sent
+        self._last_can_undo = False
+        self._last_can_redo = False
 
     def add_layer(self, item: QGraphicsItem, record_undo: bool = True):
         """Add an annotation layer."""
         self._layers.append(item)
+        self._layer_ids.add(id(item))
 
         if record_undo:
-            self._undo_stack.push({
-                'type': 'add',
-                'item': item
-            })
+            self._undo_stack.push(AddAction(item))
             self._emit_undo_signals()
 
         self.layers_changed.emit()
 
     def remove_layer(self, item: QGraphicsItem, record_undo: bool = True):
         """Remove an annotation layer."""
-        if item in self._layers:
+        if id(item) in self._layer_ids:
             index = self._layers.index(item)
-            self._layers.remove(item)
+            del self._layers[index]
+            self._layer_ids.discard(id(item))
 
             if record_undo:
-                self._undo_stack.push({
-                    'type': 'remove',
-                    'item': item,
-                    'index': index
-                })
+                self._undo_stack.push(RemoveAction(item, index))
                 self._emit_undo_signals()
 
             self.layers_changed.emit()
@@ -103,18 +119,17 @@ class LayerManager(QObject):
             return
 
         if record_undo:
-            self._undo_stack.push({
-                'type': 'clear',
-                'items': self._layers.copy()
-            })
+            # Hand the list itself to the record; it's replaced, not mutated
+            self._undo_stack.push(ClearAction(self._layers))
             self._emit_undo_signals()
 
-        self._layers.clear()
+        self._layers = []
+        self._layer_ids.clear()
         self.layers_changed.emit()
 
-    def get_layers(self) -> list:
-        """Get all layers."""
-        return self._layers.copy()
+    def get_layers(self) -> tuple:
+        """Get all layers as a read-only snapshot."""
+        return tuple(self._layers)
 
     def undo(self, canvas) -> bool:
         """Undo the last action."""
@@ -122,25 +137,29 @@ class LayerManager(QObject):
         if not action:
             return False
 
-        if action['type'] == 'add':
+        if isinstance(action, AddAction):
             # Undo add = remove
-            item = action['item']
-            if item in self._layers:
+            item = action.item
+            if id(item) in self._layer_ids:
                 self._layers.remove(item)
+                self._layer_ids.discard(id(item))
                 canvas.remove_annotation(item)
 
-        elif action['type'] == 'remove':
+        elif isinstance(action, RemoveAction):
             # Undo remove = add back
-            item = action['item']
-            index = action.get('index', len(self._layers))
+            item = action.item
+            index = action.index
             self._layers.insert(index, item)
+            self._layer_ids.add(id(item))
             canvas.add_annotation(item)
 
-        elif action['type'] == 'clear':
-            # Undo clear = restore all
-            for item in action['items']:
-                self._layers.append(item)
-                canvas.add_annotation(item)
+        elif isinstance(action, ClearAction):
+            # Undo clear = restore all, repainting once
+            with canvas.batch_updates():
+                for item in action.items:
+                    self._layers.append(item)
+                    self._layer_ids.add(id(item))
+                    canvas.add_annotation(item)
 
         self._emit_undo_signals()
         self.layers_changed.emit()
@@ -152,24 +171,28 @@ class LayerManager(QObject):
         if not action:
             return False
 
-        if action['type'] == 'add':
+        if isinstance(action, AddAction):
             # Redo add = add again
-            item = action['item']
+            item = action.item
             self._layers.append(item)
+            self._layer_ids.add(id(item))
             canvas.add_annotation(item)
 
-        elif action['type'] == 'remove':
+        elif isinstance(action, RemoveAction):
             # Redo remove = remove again
-            item = action['item']
-            if item in self._layers:
+            item = action.item
+            if id(item) in self._layer_ids:
                 self._layers.remove(item)
+                self._layer_ids.discard(id(item))
                 canvas.remove_annotation(item)
 
-        elif action['type'] == 'clear':
-            # Redo clear = clear again
-            for item in self._layers.copy():
-                self._layers.remove(item)
-                canvas.remove_annotation(item)
+        elif isinstance(action, ClearAction):
+            # Redo clear = clear again, repainting once
+            with canvas.batch_updates():
+                for item in self._layers:
+                    canvas.remove_annotation(item)
+            self._layers = []
+            self._layer_ids.clear()
 
         self._emit_undo_signals()
         self.layers_changed.emit()
@@ -184,6 +207,13 @@ class LayerManager(QObject):
         return self._undo_stack.can_redo()
 
     def _emit_undo_signals(self):
-        """Emit undo/redo availability signals."""
-        self.can_undo_changed.emit(self.can_undo())
-        self.can_redo_changed.emit(self.can_redo())
+        """Emit undo/redo availability signals when they change."""
+        can_undo = self.can_undo()
+        if can_undo != self._last_can_undo:
+            self._last_can_undo = can_undo
+            self.can_undo_changed.emit(can_undo)
+
+        can_redo = self.can_redo()
+        if can_redo != self._last_can_redo:
+            self._last_can_redo = can_redo
+            self.can_redo_changed.emit(can_redo)
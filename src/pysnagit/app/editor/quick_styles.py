@@ -1,9 +1,8 @@
 """Quick Styles - Pre-defined color and thickness combinations for fast annotation."""
 
-from PyQt6.QtWidgets import QPushButton, QWidget, QHBoxLayout, QVBoxLayout, QLabel, QFrame, QGraphicsDropShadowEffect
-from PyQt6.QtCore import pyqtSignal, Qt, QSize
-from PyQt6.QtGui import QColor, QPainter, QPen, QBrush
-from ..styles import MACOS_COLORS, MACOS_RADIUS
+from PyQt6.QtWidgets import QPushButton, QWidget, QHBoxLayout, QVBoxLayout, QLabel, QFrame
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, Qt, QSize
+from PyQt6.QtGui import QColor, QPainter, QPen, QBrush, QImage, QPixmap
 from ..animations import AnimationManager
 
 
@@ -32,42 +31,39 @@ class QuickStyleButton(QPushButton):
     def __init__(self, style: QuickStyle, parent=None):
         super().__init__(parent)
         self.style = style
-        self._shadow = None
+        self._thumb = None
 
         self.setFixedSize(80, 80)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.clicked.connect(lambda: self.style_selected.emit(self.style))
-        self._setup_shadow()
-
-        # macOS Big Sur+ styling
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {MACOS_COLORS['bg_white']};
-                border: 2px solid {MACOS_COLORS['border_light']};
-                border-radius: {MACOS_RADIUS['large']};
-            }}
-            QPushButton:hover {{
-                border-color: {MACOS_COLORS['primary']};
-                background-color: {MACOS_COLORS['primary_ultra_light']};
-            }}
-            QPushButton:pressed {{
-                background-color: {MACOS_COLORS['primary_light']};
-            }}
-        """)
-
-    def _setup_shadow(self):
-        """Add professional shadow effect."""
-        self._shadow = QGraphicsDropShadowEffect(self)
-        self._shadow.setBlurRadius(15)
-        self._shadow.setOffset(0, 3)
-        self._shadow.setColor(QColor(0, 0, 0, 20))
-        self.setGraphicsEffect(self._shadow)
+        self.clicked.connect(self._emit_style)
+
+        self.setProperty("class", "quickStyle")
+
+    @pyqtSlot()
+    def _emit_style(self):
+        """Emit style_selected with this button's style."""
+        self.style_selected.emit(self.style)
 
     def paintEvent(self, event):
-        """Custom paint to show color circle and thickness line."""
+        """Paint the button, then blit the cached style thumbnail."""
         super().paintEvent(event)
 
+        if self._thumb is None:
+            self._thumb = self._render_thumb()
+
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._thumb)
+        painter.end()
+
+    def _render_thumb(self) -> QPixmap:
+        """Rasterize the color circle and thickness line once."""
+        ratio = self.devicePixelRatioF()
+        image = QImage(round(self.width() * ratio), round(self.height() * ratio),
+                       QImage.Format.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(ratio)
+        image.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(image)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Draw color circle
@@ -90,62 +86,20 @@ class QuickStyleButton(QPushButton):
         painter.drawLine(line_start_x, line_y, line_end_x, line_y)
 
         painter.end()
-
-    def enterEvent(self, event):
-        """Handle hover - enhance shadow."""
-        super().enterEvent(event)
-        if self._shadow:
-            self._shadow.setBlurRadius(22)
-            self._shadow.setOffset(0, 5)
-            self._shadow.setColor(QColor(0, 122, 255, 40))
-
-    def leaveEvent(self, event):
-        """Handle hover end - return shadow to normal."""
-        super().leaveEvent(event)
-        if self._shadow:
-            self._shadow.setBlurRadius(15)
-            self._shadow.setOffset(0, 3)
-            self._shadow.setColor(QColor(0, 0, 0, 20))
-
-    def mousePressEvent(self, event):
-        """Handle press - reduce shadow for tactile feel."""
-        if self._shadow:
-            self._shadow.setBlurRadius(8)
-            self._shadow.setOffset(0, 1)
-        super().mousePressEvent(event)
-
-    def mouseReleaseEvent(self, event):
-        """Handle release - restore shadow."""
-        if self._shadow:
-            if self.underMouse():
-                self._shadow.setBlurRadius(22)
-                self._shadow.setOffset(0, 5)
-                self._shadow.setColor(QColor(0, 122, 255, 40))
-            else:
-                self._shadow.setBlurRadius(15)
-                self._shadow.setOffset(0, 3)
-                self._shadow.setColor(QColor(0, 0, 0, 20))
-        super().mouseReleaseEvent(event)
+        return QPixmap.fromImage(image)
 
 
 class QuickStylesPanel(QWidget):
-    """Panel containing pre-defined quick style buttons with floating effect."""
+    """Panel containing pre-defined quick style buttons."""
 
     style_applied = pyqtSignal(QuickStyle)
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._shadow = None
+        self._buttons_built = False
+        self._home_pos = None
+        self._slide = None
         self._setup_ui()
-        self._setup_shadow()
-
-    def _setup_shadow(self):
-        """Add floating shadow effect."""
-        self._shadow = QGraphicsDropShadowEffect(self)
-        self._shadow.setBlurRadius(30)
-        self._shadow.setOffset(0, 8)
-        self._shadow.setColor(QColor(0, 0, 0, 40))
-        self.setGraphicsEffect(self._shadow)
 
     def _setup_ui(self):
         """Set up the Quick Styles panel UI."""
@@ -153,37 +107,28 @@ class QuickStylesPanel(QWidget):
         layout.setSpacing(12)
         layout.setContentsMargins(16, 16, 16, 16)
 
-        # Panel styling - translucent card
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: {MACOS_COLORS['bg_white']};
-                border: 1px solid {MACOS_COLORS['border_light']};
-                border-radius: {MACOS_RADIUS['large']};
-            }}
-        """)
+        # Panel styling comes from the app theme (#quickStylesPanel)
+        self.setObjectName("quickStylesPanel")
 
         # Title
         title = QLabel("Quick Styles")
-        title.setStyleSheet(f"""
-            font-size: 13px;
-            font-weight: 600;
-            color: {MACOS_COLORS['text_primary']};
-            background: transparent;
-            border: none;
-        """)
+        title.setObjectName("quickStylesTitle")
         layout.addWidget(title)
 
         # Subtitle
         subtitle = QLabel("One-click color and thickness presets")
-        subtitle.setStyleSheet(f"""
-            font-size: 11px;
-            color: {MACOS_COLORS['text_secondary']};
-            background: transparent;
-            border: none;
-            margin-bottom: 8px;
-        """)
+        subtitle.setObjectName("quickStylesSubtitle")
         layout.addWidget(subtitle)
 
+        # Set fixed width for the panel
+        self.setFixedWidth(220)
+
+    def _build_buttons(self):
+        """Create the style buttons; deferred until the panel is first shown."""
+        if self._buttons_built:
+            return
+        self._buttons_built = True
+
         # Default Quick Styles
         default_styles = [
             QuickStyle("Thin Red", QColor(255, 107, 107), 2),
@@ -209,7 +154,6 @@ class QuickStylesPanel(QWidget):
 
             # Add name label below button
             style_container = QWidget()
-            style_container.setStyleSheet("background: transparent; border: none;")
             container_layout = QVBoxLayout(style_container)
             container_layout.setSpacing(4)
             container_layout.setContentsMargins(0, 0, 0, 0)
@@ -218,12 +162,7 @@ class QuickStylesPanel(QWidget):
 
             name_label = QLabel(style.name)
             name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            name_label.setStyleSheet(f"""
-                font-size: 10px;
-                color: {MACOS_COLORS['text_secondary']};
-                background: transparent;
-                border: none;
-            """)
+            name_label.setProperty("class", "styleName")
             container_layout.addWidget(name_label)
 
             # Add to appropriate column
@@ -235,11 +174,10 @@ class QuickStylesPanel(QWidget):
         buttons_layout.addLayout(col1_layout)
         buttons_layout.addLayout(col2_layout)
 
+        layout = self.layout()
         layout.addLayout(buttons_layout)
         layout.addStretch()
-
-        # Set fixed width for the panel
-        self.setFixedWidth(220)
+        self.adjustSize()
 
     def _on_style_selected(self, style: QuickStyle):
         """Handle style selection."""
@@ -247,12 +185,40 @@ class QuickStylesPanel(QWidget):
 
     def show_panel(self):
         """Show panel with slide-in animation."""
+        self._build_buttons()
+        self._stop_slide()
+        if self._home_pos is None:
+            self._home_pos = self.pos()
+        else:
+            self.move(self._home_pos)
         self.setVisible(True)
-        AnimationManager.slide_in(self, direction="right", duration=250, distance=30)
+        self._slide = AnimationManager.slide_in(
+            self, direction="right", duration=250, distance=30,
+            on_finished=self._on_slide_in_finished
+        )
 
     def hide_panel(self):
         """Hide panel with slide-out animation."""
-        AnimationManager.slide_out(self, direction="right", duration=250, distance=30)
-        # Hide after animation completes
-        from PyQt6.QtCore import QTimer
-        QTimer.singleShot(250, lambda: self.setVisible(False))
+        self._stop_slide()
+        if self._home_pos is not None:
+            self.move(self._home_pos)
+        self._slide = AnimationManager.slide_out(
+            self, direction="right", duration=250, distance=30,
+            on_finished=self._on_slide_out_finished
+        )
+
+    def _stop_slide(self):
+        """Stop an in-flight slide so rapid toggles don't stack animations."""
+        if self._slide is not None:
+            self._slide.stop()
+            self._slide = None
+
+    def _on_slide_in_finished(self):
+        self._slide = None
+
+    def _on_slide_out_finished(self):
+        """Hide once the slide-out ends and restore the resting position."""
+        self._slide = None
+        self.setVisible(False)
+        if self._home_pos is not None:
+            self.move(self._home_pos)
@@ -2,51 +2,29 @@
 
 from PyQt6.QtWidgets import (
     QToolBar, QWidget, QHBoxLayout, QPushButton,
-    QColorDialog, QSpinBox, QLabel, QComboBox, QToolButton, QSlider,
-    QGraphicsDropShadowEffect
+    QColorDialog, QSpinBox, QLabel, QComboBox, QToolButton, QSlider
 )
-from PyQt6.QtCore import pyqtSignal, Qt, QPropertyAnimation, QEasingCurve, QSize
-from PyQt6.QtGui import QIcon, QPixmap, QColor, QPainter, QAction
-from ..styles import MACOS_COLORS, MACOS_RADIUS
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, Qt, QPropertyAnimation, QEasingCurve, QSize
+from PyQt6.QtGui import QIcon, QImage, QPixmap, QColor, QPainter, QAction
 from ..animations import AnimationManager
 from ..utils.icon_loader import IconLoader
 from .quick_styles import QuickStylesPanel
 
 
 class ColorButton(QPushButton):
-    """Button that displays and selects a color - macOS Big Sur+ style with shadow."""
+    """Button that displays and selects a color - macOS Big Sur+ style."""
 
     color_changed = pyqtSignal(QColor)
 
     def __init__(self, color: QColor = QColor(255, 0, 0), parent=None):
         super().__init__(parent)
         self._color = color
-        self._shadow = None
         self.setFixedSize(40, 40)  # Larger for macOS style
         self.clicked.connect(self._pick_color)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self._update_icon()
-        self._setup_shadow()
-
-        # macOS styling with ring shadow
-        self.setStyleSheet(f"""
-            QPushButton {{
-                border: 2px solid {MACOS_COLORS['border']};
-                border-radius: {MACOS_RADIUS['medium']};
-                background: transparent;
-            }}
-            QPushButton:hover {{
-                border-color: {MACOS_COLORS['primary']};
-            }}
-        """)
-
-    def _setup_shadow(self):
-        """Add professional shadow effect."""
-        self._shadow = QGraphicsDropShadowEffect(self)
-        self._shadow.setBlurRadius(12)
-        self._shadow.setOffset(0, 2)
-        self._shadow.setColor(QColor(0, 0, 0, 25))
-        self.setGraphicsEffect(self._shadow)
+
+        self.setObjectName("colorButton")
 
     def color(self) -> QColor:
         return self._color
@@ -57,18 +35,18 @@ class ColorButton(QPushButton):
 
     def _update_icon(self):
         """Update the button icon to show current color."""
-        pixmap = QPixmap(32, 32)
-        pixmap.fill(Qt.GlobalColor.transparent)
+        image = QImage(32, 32, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
 
         # Draw color swatch with rounded corners
-        painter = QPainter(pixmap)
+        painter = QPainter(image)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setBrush(self._color)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawRoundedRect(2, 2, 28, 28, 8, 8)
         painter.end()
 
-        self.setIcon(QIcon(pixmap))
+        self.setIcon(QIcon(QPixmap.fromImage(image)))
 
     def _pick_color(self):
         """Open color picker dialog."""
@@ -78,34 +56,6 @@ class ColorButton(QPushButton):
             self._update_icon()
             self.color_changed.emit(color)
 
-    def enterEvent(self, event):
-        """Handle hover - enhance shadow."""
-        super().enterEvent(event)
-        if self._shadow:
-            self._shadow.setBlurRadius(18)
-            self._shadow.setColor(QColor(0, 122, 255, 50))
-
-    def leaveEvent(self, event):
-        """Handle hover end - return shadow to normal."""
-        super().leaveEvent(event)
-        if self._shadow:
-            self._shadow.setBlurRadius(12)
-            self._shadow.setColor(QColor(0, 0, 0, 25))
-
-    def mousePressEvent(self, event):
-        """Handle press - reduce shadow for tactile feel."""
-        if self._shadow:
-            self._shadow.setBlurRadius(6)
-            self._shadow.setOffset(0, 1)
-        super().mousePressEvent(event)
-
-    def mouseReleaseEvent(self, event):
-        """Handle release - restore shadow."""
-        if self._shadow:
-            self._shadow.setBlurRadius(18 if self.underMouse() else 12)
-            self._shadow.setOffset(0, 2)
-        super().mouseReleaseEvent(event)
-
 
 class EditorToolbar(QToolBar):
     """Toolbar for the image editor."""
@@ -123,6 +73,7 @@ class EditorToolbar(QToolBar):
         self._quick_styles_panel = None
         self._quick_styles_btn = None
 
+        self.setObjectName("editorToolbar")
         self.setMovable(False)
         self._setup_tools()
         self._setup_quick_styles()
@@ -153,12 +104,7 @@ class EditorToolbar(QToolBar):
 
         # Color picker - more compact
         color_label = QLabel("Color")
-        color_label.setStyleSheet(f"""
-            color: {MACOS_COLORS['text_secondary']};
-            font-size: 11px;
-            font-weight: 600;
-            padding: 0 4px;
-        """)
+        color_label.setProperty("class", "section")
         self.addWidget(color_label)
 
         self._color_button = ColorButton(QColor(255, 0, 0))
@@ -169,12 +115,7 @@ class EditorToolbar(QToolBar):
 
         # Line thickness - slider instead of spinbox for modern feel
         thickness_label = QLabel("Thickness")
-        thickness_label.setStyleSheet(f"""
-            color: {MACOS_COLORS['text_secondary']};
-            font-size: 11px;
-            font-weight: 600;
-            padding: 0 4px;
-        """)
+        thickness_label.setProperty("class", "section")
         self.addWidget(thickness_label)
 
         # Thickness slider widget
@@ -187,38 +128,13 @@ class EditorToolbar(QToolBar):
         self._thickness_slider.setRange(1, 20)
         self._thickness_slider.setValue(3)
         self._thickness_slider.setFixedWidth(100)
-        self._thickness_slider.setStyleSheet(f"""
-            QSlider::groove:horizontal {{
-                border: none;
-                height: 4px;
-                background: {MACOS_COLORS['border_light']};
-                border-radius: 2px;
-            }}
-            QSlider::handle:horizontal {{
-                background: {MACOS_COLORS['primary']};
-                border: none;
-                width: 16px;
-                height: 16px;
-                margin: -6px 0;
-                border-radius: 8px;
-            }}
-            QSlider::handle:horizontal:hover {{
-                background: {MACOS_COLORS['primary_hover']};
-            }}
-        """)
+        self._thickness_slider.setObjectName("thicknessSlider")
         self._thickness_slider.valueChanged.connect(self.thickness_changed.emit)
         thickness_layout.addWidget(self._thickness_slider)
 
         self._thickness_value_label = QLabel("3")
-        self._thickness_value_label.setStyleSheet(f"""
-            color: {MACOS_COLORS['text_primary']};
-            font-size: 12px;
-            font-weight: 600;
-            min-width: 20px;
-        """)
-        self._thickness_slider.valueChanged.connect(
-            lambda v: self._thickness_value_label.setText(str(v))
-        )
+        self._thickness_value_label.setObjectName("thicknessValue")
+        self._thickness_slider.valueChanged.connect(self._thickness_value_label.setNum)
         thickness_layout.addWidget(self._thickness_value_label)
 
         self.addWidget(thickness_container)
@@ -227,30 +143,14 @@ class EditorToolbar(QToolBar):
 
         # Font size - compact spinbox
         font_label = QLabel("Font")
-        font_label.setStyleSheet(f"""
-            color: {MACOS_COLORS['text_secondary']};
-            font-size: 11px;
-            font-weight: 600;
-            padding: 0 4px;
-        """)
+        font_label.setProperty("class", "section")
         self.addWidget(font_label)
 
         self._font_spin = QSpinBox()
         self._font_spin.setRange(8, 72)
         self._font_spin.setValue(14)
         self._font_spin.setFixedWidth(60)
-        self._font_spin.setStyleSheet(f"""
-            QSpinBox {{
-                background-color: {MACOS_COLORS['bg_white']};
-                border: 1px solid {MACOS_COLORS['border_light']};
-                border-radius: {MACOS_RADIUS['small']};
-                padding: 4px 8px;
-                font-size: 12px;
-            }}
-            QSpinBox:hover {{
-                border-color: {MACOS_COLORS['primary']};
-            }}
-        """)
+        self._font_spin.setObjectName("fontSpin")
         self._font_spin.valueChanged.connect(self.font_size_changed.emit)
         self.addWidget(self._font_spin)
 
@@ -266,33 +166,22 @@ class EditorToolbar(QToolBar):
         # Tooltip with name and shortcut
         button.setToolTip(f"{name}\n{tooltip}")
         button.setCheckable(True)
-        button.clicked.connect(lambda checked, t=tool_id: self._on_tool_clicked(t))
+        button.setProperty("toolId", tool_id)
+        button.clicked.connect(self._on_tool_button_clicked)
 
         # macOS-style button appearance
         button.setFixedSize(44, 44)
-        button.setStyleSheet(f"""
-            QToolButton {{
-                background-color: transparent;
-                border: none;
-                border-radius: {MACOS_RADIUS['medium']};
-                padding: 8px;
-            }}
-            QToolButton:hover {{
-                background-color: {MACOS_COLORS['bg_hover']};
-            }}
-            QToolButton:checked {{
-                background-color: {MACOS_COLORS['primary_ultra_light']};
-                border: 2px solid {MACOS_COLORS['primary']};
-            }}
-            QToolButton:pressed {{
-                background-color: {MACOS_COLORS['border_light']};
-            }}
-        """)
+        button.setProperty("class", "tool")
         button.setCursor(Qt.CursorShape.PointingHandCursor)
 
         self._tool_buttons[tool_id] = button
         self.addWidget(button)
 
+    @pyqtSlot()
+    def _on_tool_button_clicked(self):
+        """Route a tool button click to the tool stored on the button."""
+        self._on_tool_clicked(self.sender().property("toolId"))
+
     def _on_tool_clicked(self, tool_id: str):
         """Handle tool button click with smooth animation."""
         # Animate previously selected button back to normal
@@ -357,26 +246,7 @@ class EditorToolbar(QToolBar):
         self._quick_styles_btn.setCheckable(True)
         self._quick_styles_btn.setToolTip("Show/hide quick style presets (one-click color & thickness)")
         self._quick_styles_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._quick_styles_btn.setStyleSheet(f"""
-            QToolButton {{
-                background-color: {MACOS_COLORS['bg_white']};
-                border: 1px solid {MACOS_COLORS['border_light']};
-                border-radius: {MACOS_RADIUS['medium']};
-                padding: 6px 12px;
-                font-size: 12px;
-                font-weight: 600;
-                color: {MACOS_COLORS['text_primary']};
-            }}
-            QToolButton:hover {{
-                background-color: {MACOS_COLORS['bg_hover']};
-                border-color: {MACOS_COLORS['primary']};
-            }}
-            QToolButton:checked {{
-                background-color: {MACOS_COLORS['primary_ultra_light']};
-                border-color: {MACOS_COLORS['primary']};
-                color: {MACOS_COLORS['primary']};
-            }}
-        """)
+        self._quick_styles_btn.setObjectName("quickStylesButton")
         self._quick_styles_btn.clicked.connect(self._toggle_quick_styles)
         self.addWidget(self._quick_styles_btn)
 
@@ -1,63 +1,86 @@
 """Crop tool."""
 
-from PyQt6.QtCore import QPointF, QRectF, Qt, pyqtSignal, QObject
-from PyQt6.QtWidgets import QGraphicsRectItem
+from PyQt6.QtCore import QPointF, QRectF, Qt, QTimer, pyqtSignal, QObject
+from PyQt6.QtWidgets import QGraphicsItem, QGraphicsRectItem
 from PyQt6.QtGui import QPen, QBrush, QColor, QCursor
 
 from .base import BaseTool
 
+# Minimum interval between crop overlay updates while dragging (~60 Hz)
+MOVE_THROTTLE_MS = 16
+
 
 class CropOverlay(QGraphicsRectItem):
     """Overlay showing the crop area."""
 
+    # Extra margin around the crop rect covering the border pen and handles
+    _DIRTY_MARGIN = 6
+    _HANDLE_SIZE = 8
+
     def __init__(self, scene_rect: QRectF):
         super().__init__(scene_rect)
         self._crop_rect = QRectF()
+        self._handle_rects = []
         self._scene_rect = scene_rect
 
         # Dark overlay
         self.setPen(QPen(Qt.PenStyle.NoPen))
         self.setBrush(QBrush(QColor(0, 0, 0, 150)))
 
+        # Needed for option.exposedRect to hold the actual dirty area
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+
     def set_crop_rect(self, rect: QRectF):
-        """Set the crop selection rectangle."""
+        """Set the crop selection rectangle, repainting only what changed."""
+        prev = self._crop_rect
         self._crop_rect = rect
-        self.update()
+
+        # Corner handle rects are rebuilt here, once per drag update
+        half = self._HANDLE_SIZE / 2
+        self._handle_rects = [
+            QRectF(corner.x() - half, corner.y() - half, self._HANDLE_SIZE, self._HANDLE_SIZE)
+            for corner in (rect.topLeft(), rect.topRight(), rect.bottomLeft(), rect.bottomRight())
+        ]
+
+        # Outside both the old and new selection the overlay stays dark
+        if prev.isEmpty():
+            dirty = rect
+        else:
+            dirty = prev.united(rect)
+        m = self._DIRTY_MARGIN
+        self.update(dirty.adjusted(-m, -m, m, m))
 
     def paint(self, painter, option, widget):
-        """Custom paint to show crop area as transparent."""
-        # Fill the entire area with dark overlay
-        painter.fillRect(self._scene_rect, QColor(0, 0, 0, 150))
+        """Shade everything outside the crop area and outline the selection."""
+        painter.setClipRect(option.exposedRect)
+
+        shade = QColor(0, 0, 0, 150)
+        scene = self._scene_rect
+        crop = self._crop_rect.intersected(scene)
+
+        if crop.isEmpty():
+            painter.fillRect(scene, shade)
+        else:
+            # Darken the four bands around the crop area, never the area itself
+            painter.fillRect(QRectF(scene.left(), scene.top(),
+                                    scene.width(), crop.top() - scene.top()), shade)
+            painter.fillRect(QRectF(scene.left(), crop.bottom(),
+                                    scene.width(), scene.bottom() - crop.bottom()), shade)
+            painter.fillRect(QRectF(scene.left(), crop.top(),
+                                    crop.left() - scene.left(), crop.height()), shade)
+            painter.fillRect(QRectF(crop.right(), crop.top(),
+                                    scene.right() - crop.right(), crop.height()), shade)
 
-        # Cut out the crop area (make it transparent)
         if not self._crop_rect.isEmpty():
-            painter.setCompositionMode(painter.CompositionMode.CompositionMode_Clear)
-            painter.fillRect(self._crop_rect, Qt.GlobalColor.transparent)
-
             # Draw crop border
-            painter.setCompositionMode(painter.CompositionMode.CompositionMode_SourceOver)
             painter.setPen(QPen(QColor(255, 255, 255), 2, Qt.PenStyle.DashLine))
             painter.drawRect(self._crop_rect)
 
             # Draw corner handles
-            handle_size = 8
             painter.setBrush(QBrush(QColor(255, 255, 255)))
             painter.setPen(QPen(QColor(0, 0, 0), 1))
-
-            corners = [
-                self._crop_rect.topLeft(),
-                self._crop_rect.topRight(),
-                self._crop_rect.bottomLeft(),
-                self._crop_rect.bottomRight()
-            ]
-
-            for corner in corners:
-                painter.drawRect(
-                    int(corner.x() - handle_size / 2),
-                    int(corner.y() - handle_size / 2),
-                    handle_size,
-                    handle_size
-                )
+            for handle in self._handle_rects:
+                painter.drawRect(handle)
 
 
 class CropTool(BaseTool):
@@ -68,6 +91,13 @@ class CropTool(BaseTool):
         self._overlay = None
         self._crop_rect = QRectF()
 
+        # Coalesce drag updates to roughly one per display frame
+        self._pending_pos = None
+        self._move_timer = QTimer()
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(MOVE_THROTTLE_MS)
+        self._move_timer.timeout.connect(self._flush_move)
+
     def cursor(self) -> QCursor:
         """Return crop cursor."""
         return QCursor(Qt.CursorShape.CrossCursor)
@@ -89,19 +119,33 @@ class CropTool(BaseTool):
         if not self._is_drawing or not self._overlay:
             return
 
+        self._pending_pos = pos
+        if not self._move_timer.isActive():
+            self._move_timer.start()
+
+    def _flush_move(self):
+        """Apply the latest pending drag position to the crop selection."""
+        self._move_timer.stop()
+        pos = self._pending_pos
+        if pos is None or self._start_pos is None:
+            return
+        self._pending_pos = None
+
         self._crop_rect = QRectF(
             min(self._start_pos.x(), pos.x()),
             min(self._start_pos.y(), pos.y()),
             abs(pos.x() - self._start_pos.x()),
             abs(pos.y() - self._start_pos.y())
         )
-        self._overlay.set_crop_rect(self._crop_rect)
+        if self._overlay:
+            self._overlay.set_crop_rect(self._crop_rect)
 
     def on_release(self, pos: QPointF, canvas):
         """Finish crop selection - apply crop."""
         if not self._is_drawing:
             return
 
+        self._flush_move()
         self._is_drawing = False
 
         # Remove overlay
@@ -129,8 +173,19 @@ class CropTool(BaseTool):
         if right <= x or bottom <= y:
             return
 
+        # Defer the pixel copy so the release event (overlay removal,
+        # cursor restore) completes first
+        source = canvas._pil_image
+        box = (x, y, right, bottom)
+        QTimer.singleShot(0, lambda: self._finish_crop(canvas, source, box))
+
+    def _finish_crop(self, canvas, source, box):
+        """Crop source and load the result, unless the image changed meanwhile."""
+        if canvas._pil_image is not source:
+            return
+
         # Crop the image
-        cropped = canvas._pil_image.crop((x, y, right, bottom))
+        cropped = source.crop(box)
 
         # Clear annotations (they're relative to old image)
         canvas.clear_annotations()
@@ -141,6 +196,8 @@ class CropTool(BaseTool):
     def on_cancel(self):
         """Cancel crop selection."""
         super().on_cancel()
+        self._move_timer.stop()
+        self._pending_pos = None
         self._crop_rect = QRectF()
 
     def get_crop_rect(self) -> QRectF:
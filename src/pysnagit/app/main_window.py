@@ -20,7 +20,7 @@ from .utils.file_io import save_image, get_save_path, generate_filename
 from .utils.settings import Settings
 from .utils.logger import get_logger
 from .utils.icon_loader import IconLoader
-from .styles import DARK_THEME, COLORS, MACOS_BIGSUR_THEME, MACOS_COLORS, MACOS_RADIUS
+from .styles import DARK_THEME, COLORS, MACOS_COLORS, MACOS_RADIUS
 from .animations import AnimationManager
 
 log = get_logger("main_window")
@@ -206,10 +206,6 @@ class MainWindow(QMainWindow):
             self._recording_mode = "video"
             self._has_shown_animation = False
 
-            # Apply macOS Big Sur+ theme
-            log.debug("Applying macOS Big Sur+ theme...")
-            self.setStyleSheet(MACOS_BIGSUR_THEME)
-
             log.debug("Setting up UI...")
             self._setup_ui()
 
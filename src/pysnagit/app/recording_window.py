@@ -9,7 +9,7 @@ from PyQt6.QtGui import QColor
 
 from .recording.video import ScreenRecorder
 from .recording.gif import GifCreator
-from .styles import DARK_THEME, COLORS, MACOS_BIGSUR_THEME, MACOS_COLORS, MACOS_RADIUS
+from .styles import DARK_THEME, COLORS, MACOS_COLORS, MACOS_RADIUS
 from .animations import AnimationManager
 
 
@@ -35,8 +35,6 @@ class RecordingControlWindow(QWidget):
         self._elapsed = 0
         self._pulse_animation = None
 
-        # Apply macOS Big Sur+ theme
-        self.setStyleSheet(MACOS_BIGSUR_THEME)
         self._setup_ui()
         self._setup_shadow()
         self._setup_recorder()
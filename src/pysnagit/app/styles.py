@@ -926,6 +926,220 @@ QFrame#cardFrame {{
 }}
 """
 
+# Editor capture toolbar; object names are set in EditorWindow._setup_ui
+CAPTURE_TOOLBAR_THEME = f"""
+QToolBar#captureToolbar {{
+    background-color: {MACOS_COLORS['bg_white']};
+    border-bottom: 1px solid {MACOS_COLORS['border_light']};
+    padding: 8px 16px;
+    spacing: 12px;
+}}
+
+QToolBar#captureToolbar QToolButton {{
+    background-color: transparent;
+    border: 1px solid transparent;
+    border-radius: {MACOS_RADIUS['medium']};
+    padding: 6px 14px;
+    font-size: 13px;
+    font-weight: 500;
+    color: {MACOS_COLORS['text_primary']};
+}}
+
+QToolBar#captureToolbar QToolButton:hover {{
+    background-color: {MACOS_COLORS['bg_hover']};
+    border-color: {MACOS_COLORS['border_light']};
+}}
+
+QToolBar#captureToolbar QToolButton:pressed {{
+    background-color: {MACOS_COLORS['border_light']};
+}}
+
+QToolBar#captureToolbar QToolButton#btnCopy {{
+    background-color: {MACOS_COLORS['primary_ultra_light']};
+    border: 1px solid {MACOS_COLORS['primary']};
+    border-radius: {MACOS_RADIUS['medium']};
+    padding: 6px 14px;
+    font-weight: 600;
+    color: {MACOS_COLORS['primary']};
+}}
+
+QToolBar#captureToolbar QToolButton#btnCopy:hover {{
+    background-color: {MACOS_COLORS['primary_light']};
+}}
+
+QToolBar#captureToolbar QToolButton#btnCopy:pressed {{
+    background-color: {MACOS_COLORS['primary']};
+    color: white;
+}}
+
+QToolBar#captureToolbar QToolButton#btnSave {{
+    background-color: {MACOS_COLORS['primary']};
+    border: none;
+    border-radius: {MACOS_RADIUS['medium']};
+    padding: 6px 14px;
+    font-weight: 600;
+    color: white;
+}}
+
+QToolBar#captureToolbar QToolButton#btnSave:hover {{
+    background-color: {MACOS_COLORS['primary_hover']};
+}}
+
+QToolBar#captureToolbar QToolButton#btnSave:pressed {{
+    background-color: {MACOS_COLORS['primary_dark']};
+}}
+"""
+
+
+EDITOR_TOOLBAR_THEME = f"""
+QToolBar#editorToolbar QToolButton[class="tool"] {{
+    background-color: transparent;
+    border: none;
+    border-radius: {MACOS_RADIUS['medium']};
+    padding: 8px;
+}}
+
+QToolBar#editorToolbar QToolButton[class="tool"]:hover {{
+    background-color: {MACOS_COLORS['bg_hover']};
+}}
+
+QToolBar#editorToolbar QToolButton[class="tool"]:checked {{
+    background-color: {MACOS_COLORS['primary_ultra_light']};
+    border: 2px solid {MACOS_COLORS['primary']};
+}}
+
+QToolBar#editorToolbar QToolButton[class="tool"]:pressed {{
+    background-color: {MACOS_COLORS['border_light']};
+}}
+
+QToolBar#editorToolbar QLabel[class="section"] {{
+    color: {MACOS_COLORS['text_secondary']};
+    font-size: 11px;
+    font-weight: 600;
+    padding: 0 4px;
+}}
+
+QToolBar#editorToolbar QPushButton#colorButton {{
+    border: 2px solid {MACOS_COLORS['border']};
+    border-radius: {MACOS_RADIUS['medium']};
+    background: transparent;
+}}
+
+QToolBar#editorToolbar QPushButton#colorButton:hover {{
+    border-color: {MACOS_COLORS['primary']};
+}}
+
+QSlider#thicknessSlider::groove:horizontal {{
+    border: none;
+    height: 4px;
+    background: {MACOS_COLORS['border_light']};
+    border-radius: 2px;
+}}
+
+QSlider#thicknessSlider::handle:horizontal {{
+    background: {MACOS_COLORS['primary']};
+    border: none;
+    width: 16px;
+    height: 16px;
+    margin: -6px 0;
+    border-radius: 8px;
+}}
+
+QSlider#thicknessSlider::handle:horizontal:hover {{
+    background: {MACOS_COLORS['primary_hover']};
+}}
+
+QLabel#thicknessValue {{
+    color: {MACOS_COLORS['text_primary']};
+    font-size: 12px;
+    font-weight: 600;
+    min-width: 20px;
+}}
+
+QSpinBox#fontSpin {{
+    background-color: {MACOS_COLORS['bg_white']};
+    border: 1px solid {MACOS_COLORS['border_light']};
+    border-radius: {MACOS_RADIUS['small']};
+    padding: 4px 8px;
+    font-size: 12px;
+}}
+
+QSpinBox#fontSpin:hover {{
+    border-color: {MACOS_COLORS['primary']};
+}}
+
+QToolButton#quickStylesButton {{
+    background-color: {MACOS_COLORS['bg_white']};
+    border: 1px solid {MACOS_COLORS['border_light']};
+    border-radius: {MACOS_RADIUS['medium']};
+    padding: 6px 12px;
+    font-size: 12px;
+    font-weight: 600;
+    color: {MACOS_COLORS['text_primary']};
+}}
+
+QToolButton#quickStylesButton:hover {{
+    background-color: {MACOS_COLORS['bg_hover']};
+    border-color: {MACOS_COLORS['primary']};
+}}
+
+QToolButton#quickStylesButton:checked {{
+    background-color: {MACOS_COLORS['primary_ultra_light']};
+    border-color: {MACOS_COLORS['primary']};
+    color: {MACOS_COLORS['primary']};
+}}
+
+QWidget#quickStylesPanel {{
+    background-color: {MACOS_COLORS['bg_white']};
+    border: 1px solid {MACOS_COLORS['border_light']};
+    border-radius: {MACOS_RADIUS['large']};
+}}
+
+QWidget#quickStylesPanel QLabel#quickStylesTitle {{
+    font-size: 13px;
+    font-weight: 600;
+    color: {MACOS_COLORS['text_primary']};
+    background: transparent;
+    border: none;
+}}
+
+QWidget#quickStylesPanel QLabel#quickStylesSubtitle {{
+    font-size: 11px;
+    color: {MACOS_COLORS['text_secondary']};
+    background: transparent;
+    border: none;
+    margin-bottom: 8px;
+}}
+
+QWidget#quickStylesPanel QLabel[class="styleName"] {{
+    font-size: 10px;
+    color: {MACOS_COLORS['text_secondary']};
+    background: transparent;
+    border: none;
+}}
+
+QWidget#quickStylesPanel QPushButton[class="quickStyle"] {{
+    background-color: {MACOS_COLORS['bg_white']};
+    border: 2px solid {MACOS_COLORS['border_light']};
+    border-radius: {MACOS_RADIUS['large']};
+}}
+
+QWidget#quickStylesPanel QPushButton[class="quickStyle"]:hover {{
+    border-color: {MACOS_COLORS['primary']};
+    background-color: {MACOS_COLORS['primary_ultra_light']};
+}}
+
+QWidget#quickStylesPanel QPushButton[class="quickStyle"]:pressed {{
+    background-color: {MACOS_COLORS['primary_light']};
+}}
+"""
+
+
+def apply_theme(app):
+    """Apply the app-wide stylesheet once; windows should not set it themselves."""
+    app.setStyleSheet(MACOS_BIGSUR_THEME + CAPTURE_TOOLBAR_THEME + EDITOR_TOOLBAR_THEME)
+
+
 # Icon mappings
 ICONS = {
     "full_screen": "",
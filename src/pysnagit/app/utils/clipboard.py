@@ -7,19 +7,32 @@ from PIL import Image
 import io
 
 
+def image_to_rgba_bytes(image: Image.Image) -> tuple[bytes, int, int]:
+    """Pack a PIL Image as RGBA bytes for the clipboard.
+
+    Safe to call off the GUI thread; returns (data, width, height).
+    """
+    if image.mode != 'RGBA':
+        image = image.convert('RGBA')
+    return image.tobytes('raw', 'RGBA'), image.width, image.height
+
+
 def copy_to_clipboard(image: Image.Image) -> bool:
     """Copy a PIL Image to the system clipboard."""
     try:
-        # Convert PIL Image to QImage (safe conversion)
-        if image.mode != 'RGBA':
-            image = image.convert('RGBA')
+        return copy_rgba_to_clipboard(*image_to_rgba_bytes(image))
+    except Exception:
+        return False
+
 
-        data = image.tobytes('raw', 'RGBA')
+def copy_rgba_to_clipboard(data: bytes, width: int, height: int) -> bool:
+    """Copy packed RGBA bytes to the system clipboard (GUI thread only)."""
+    try:
         qimage = QImage(
             data,
-            image.width,
-            image.height,
-            image.width * 4,  # bytes per line - CRITICAL for correctness
+            width,
+            height,
+            width * 4,  # bytes per line - CRITICAL for correctness
             QImage.Format.Format_RGBA8888
         )
 
@@ -1,14 +1,14 @@
 """File I/O operations for images and videos."""
 
 from pathlib import Path
-from datetime import datetime
+import time
 from PIL import Image
 from PyQt6.QtWidgets import QFileDialog
 
 
 def generate_filename(prefix: str = "capture", extension: str = "png") -> str:
     """Generate a timestamped filename."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     return f"{prefix}_{timestamp}.{extension}"
 
 
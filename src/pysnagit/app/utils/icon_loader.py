@@ -60,6 +60,9 @@ class IconLoader:
         "settings": "⚙",    # Gear
     }
 
+    # Rendered icons keyed by (name, size, rgba or None)
+    _ICON_CACHE: dict[tuple[str, int, int | None], QIcon] = {}
+
     @staticmethod
     def get_icon(name: str, size: int = 24, color: QColor = None) -> QIcon:
         """
@@ -73,6 +76,15 @@ class IconLoader:
         Returns:
             QIcon object
         """
+        key = (name, size, color.rgba() if color else None)
+        icon = IconLoader._ICON_CACHE.get(key)
+        if icon is None:
+            icon = IconLoader._ICON_CACHE[key] = IconLoader._load_icon(name, size, color)
+        return icon
+
+    @staticmethod
+    def _load_icon(name: str, size: int, color: QColor | None) -> QIcon:
+        """Render or look up an icon (uncached)."""
         # Try Unicode symbol first (better looking)
         if name in IconLoader._UNICODE_ICONS:
             return IconLoader._create_text_icon(
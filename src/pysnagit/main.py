@@ -49,6 +49,10 @@ def main():
         app.setOrganizationName("PySnagit")
         app.setQuitOnLastWindowClosed(False)
 
+        # One global stylesheet, parsed before any window is built
+        from app.styles import apply_theme
+        apply_theme(app)
+
         log.debug("Qt application created successfully")
 
         log.debug("Importing MainWindow...")